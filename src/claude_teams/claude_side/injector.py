@@ -7,22 +7,39 @@ and processed when the pane becomes ready for input.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import subprocess
-import time
 
+from claude_teams.claude_side.tmux_introspection import TMUX_BINARY, escape_tmux_arg
 from claude_teams.common.models import InboxMessage
 
 logger = logging.getLogger(__name__)
 
 # tmux send-keys -l splits text into paste events at this boundary.
 # Codex TUI treats paste events >1024 bytes as "[Pasted Content]" and
-# refuses to submit them.  Keep chunks at or below this limit.
+# refuses to submit them.  Keep chunks at or below this many UTF-8 bytes.
 _TMUX_SEND_KEYS_MAX = 1024
 
 # Short pause between chunks so the TUI can absorb each one.
 _CHUNK_DELAY = 0.2
 
+# Wait for the TUI to render the input text before pressing Enter.
+_RENDER_DELAY = 0.5
+
+# Over a control connection, poll the pane instead and press Enter as soon
+# as the tail of the text is on screen (bounded by roughly _RENDER_DELAY).
+_RENDER_POLL_INTERVAL = 0.05
+_RENDER_POLL_ATTEMPTS = 10
+_RENDER_TAIL_CHARS = 8
+
+# Give up on attaching a control client if tmux hasn't answered by then.
+_OPEN_TIMEOUT = 5.0
+
+# How long a detached control client gets to exit before it is killed.
+_CLOSE_TIMEOUT = 2.0
+
 
 def format_message_for_injection(msg: InboxMessage) -> str:
     """Format an inbox message for tmux injection.
@@ -32,58 +49,292 @@ def format_message_for_injection(msg: InboxMessage) -> str:
     return f"[Message from {msg.from_}]: {msg.text}"
 
 
-def _send_text_chunked(pane_id: str, text: str) -> None:
-    """Send text to a tmux pane in chunks to avoid the 1024-byte paste limit."""
-    for offset in range(0, len(text), _TMUX_SEND_KEYS_MAX):
-        chunk = text[offset : offset + _TMUX_SEND_KEYS_MAX]
-        subprocess.run(
-            ["tmux", "send-keys", "-t", pane_id, "-l", chunk],
-            capture_output=True,
-            text=True,
-            check=True,
+def _quote_arg(arg: str) -> str:
+    """Quote an argument for a tmux command line (control mode reads one line per command)."""
+    out = ['"']
+    for ch in arg:
+        if ch in '"\\$':
+            out.append("\\" + ch)
+        elif ch == "\n":
+            out.append("\\n")
+        elif ch < " " or ch == "\x7f":
+            out.append(f"\\{ord(ch):03o}")
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
+
+
+def _split_chunks(text: str) -> list[str]:
+    """Split `text` into chunks of at most _TMUX_SEND_KEYS_MAX UTF-8 bytes.
+
+    The limit is in bytes, so non-ASCII text is cut on code point boundaries
+    of its encoding; pure ASCII (one byte per character) is sliced directly.
+    """
+    if text.isascii():
+        return [text[i : i + _TMUX_SEND_KEYS_MAX] for i in range(0, len(text), _TMUX_SEND_KEYS_MAX)]
+    data = text.encode()
+    chunks: list[str] = []
+    start = 0
+    while start < len(data):
+        end = min(start + _TMUX_SEND_KEYS_MAX, len(data))
+        # Back off continuation bytes (10xxxxxx) so a code point is never split.
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(data[start:end].decode())
+        start = end
+    return chunks
+
+
+def _text_commands(pane_id: str, text: str) -> list[list[str]]:
+    """Return the tmux commands that type `text` into a pane, paced between chunks.
+
+    Pacing is done by tmux itself via `run-shell -d` (tmux >= 3.2), so the
+    commands can be issued as one sequence without the caller sleeping.
+    """
+    commands: list[list[str]] = []
+    for i, chunk in enumerate(_split_chunks(text)):
+        if i:
+            commands.append(["run-shell", "-d", str(_CHUNK_DELAY)])
+        # -l prevents key name interpretation; -- lets chunks start with '-'
+        commands.append(["send-keys", "-t", pane_id, "-l", "--", chunk])
+    return commands
+
+
+def _enter_command(pane_id: str) -> list[str]:
+    # Enter is sent without -l so it is interpreted as a key name
+    return ["send-keys", "-t", pane_id, "Enter"]
+
+
+def _render_tail(text: str) -> str:
+    """Whitespace-free tail of `text`, used to spot it on screen despite TUI wrapping."""
+    return "".join(text.split())[-_RENDER_TAIL_CHARS:]
+
+
+def build_inject_args(pane_id: str, text: str) -> list[str]:
+    """Build a single tmux invocation that types `text` into a pane and presses Enter.
+
+    Used when no control connection is available: the render wait is a
+    fixed in-tmux delay so the whole injection stays one process.
+    """
+    commands = [
+        *_text_commands(pane_id, text),
+        ["run-shell", "-d", str(_RENDER_DELAY)],
+        _enter_command(pane_id),
+    ]
+    args = [TMUX_BINARY]
+    for i, command in enumerate(commands):
+        if i:
+            args.append(";")
+        args += [escape_tmux_arg(a) for a in command]
+    return args
+
+
+class PersistentTmuxSender:
+    """Long-lived `tmux -C` control client used to type into a single pane.
+
+    Commands are streamed over the client's stdin, so injecting a message
+    costs a pipe write instead of a fork/exec. Create instances with
+    `await PersistentTmuxSender.open(pane_id)`. Raises OSError if the
+    control connection cannot be established or is lost, and RuntimeError
+    if tmux rejects a command.
+    """
+
+    def __init__(self, pane_id: str, proc: asyncio.subprocess.Process) -> None:
+        self.pane_id = pane_id
+        self._proc = proc
+        # Replies are matched to commands by order, so sends must not interleave.
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, pane_id: str) -> PersistentTmuxSender:
+        """Attach a control client to the session that owns `pane_id`.
+
+        Raises TimeoutError (an OSError) if tmux doesn't complete the
+        handshake within _OPEN_TIMEOUT seconds.
+        """
+        return await asyncio.wait_for(cls._open(pane_id), _OPEN_TIMEOUT)
+
+    @classmethod
+    async def _open(cls, pane_id: str) -> PersistentTmuxSender:
+        lookup = await asyncio.create_subprocess_exec(
+            TMUX_BINARY,
+            "display-message",
+            "-p",
+            "-t",
+            pane_id,
+            "#{session_id}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        if offset + _TMUX_SEND_KEYS_MAX < len(text):
-            time.sleep(_CHUNK_DELAY)
+        stdout, _ = await lookup.communicate()
+        session = stdout.decode().strip()
+        if not session:
+            raise OSError(f"no tmux session found for pane {pane_id}")
+        proc = await asyncio.create_subprocess_exec(
+            TMUX_BINARY,
+            "-C",
+            "attach-session",
+            "-f",
+            "no-output,ignore-size",
+            "-t",
+            session,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        sender = cls(pane_id, proc)
+        try:
+            # Handshake: tmux announces the attached session once the client is ready.
+            while True:
+                line = await sender._readline()
+                if line.startswith("%session-changed"):
+                    return sender
+        except BaseException:
+            # A client that failed the handshake isn't worth waiting for.
+            await sender.aclose(timeout=0)
+            raise
+
+    @property
+    def closed(self) -> bool:
+        return self._proc.returncode is not None or self._proc.stdin is None or self._proc.stdin.is_closing()
+
+    async def _readline(self) -> str:
+        assert self._proc.stdout is not None
+        line = await self._proc.stdout.readline()
+        if not line:
+            self.close()
+            raise BrokenPipeError("tmux control client exited")
+        return line.decode(errors="replace")
+
+    async def _read_replies(self, count: int) -> str:
+        """Consume one %begin/%end block per command and return the last block's output.
+
+        tmux skips the rest of a command sequence after a failure, so the
+        first %error ends the sequence and is raised as RuntimeError.
+        """
+        body: list[str] = []
+        tag: str | None = None
+        while count:
+            line = await self._readline()
+            if tag is None:
+                if line.startswith("%begin"):
+                    tag = line[len("%begin") :]
+                    body = []
+            elif line == "%end" + tag:
+                tag = None
+                count -= 1
+            elif line == "%error" + tag:
+                raise RuntimeError("".join(body).strip() or "tmux command failed")
+            else:
+                body.append(line)
+        return "".join(body)
+
+    async def _run(self, commands: list[list[str]]) -> str:
+        """Run a command sequence over the control connection; return the last command's output."""
+        assert self._proc.stdin is not None
+        line = " ; ".join(" ".join(_quote_arg(a) for a in command) for command in commands)
+        try:
+            self._proc.stdin.write(line.encode() + b"\n")
+            await self._proc.stdin.drain()
+        except OSError:
+            self.close()
+            raise
+        return await self._read_replies(len(commands))
 
+    async def _wait_for_render(self, text: str) -> None:
+        """Poll the visible pane until the tail of `text` shows up (or give up)."""
+        tail = _render_tail(text)
+        capture = ["capture-pane", "-p", "-J", "-t", self.pane_id]
+        for _ in range(_RENDER_POLL_ATTEMPTS):
+            screen = await self._run([capture])
+            if tail in "".join(screen.split()):
+                return
+            await asyncio.sleep(_RENDER_POLL_INTERVAL)
 
-def inject_message(pane_id: str, msg: InboxMessage) -> bool:
-    """Inject a single message into a tmux pane via send-keys.
+    async def send(self, text: str) -> None:
+        """Type `text` into the pane and press Enter once it has rendered."""
+        async with self._lock:
+            await self._run(_text_commands(self.pane_id, text))
+            await self._wait_for_render(text)
+            await self._run([_enter_command(self.pane_id)])
+
+    def close(self) -> None:
+        """Detach the control client (tmux exits once its stdin is closed)."""
+        if self._proc.stdin is not None and not self._proc.stdin.is_closing():
+            self._proc.stdin.close()
+
+    async def aclose(self, timeout: float = _CLOSE_TIMEOUT) -> None:
+        """Detach the control client and reap it, killing it if it hasn't exited within `timeout` seconds."""
+        self.close()
+        try:
+            await asyncio.wait_for(self._proc.wait(), timeout)
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                self._proc.kill()
+            await self._proc.wait()
+
+
+async def _run_tmux(args: list[str]) -> None:
+    """Run a one-shot tmux command, raising CalledProcessError on failure."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, stderr=stderr)
+
+
+async def inject_message(
+    pane_id: str,
+    msg: InboxMessage | str,
+    sender: PersistentTmuxSender | None = None,
+) -> bool:
+    """Inject a single message (or pre-formatted text) into a tmux pane via send-keys.
+
+    Uses `sender` when given, falling back to a one-shot tmux invocation
+    if its control connection has been lost.
 
     Returns True if the injection succeeded, False otherwise.
     """
-    text = format_message_for_injection(msg)
+    text = msg if isinstance(msg, str) else format_message_for_injection(msg)
+
+    if sender is not None and not sender.closed:
+        try:
+            await sender.send(text)
+            return True
+        except RuntimeError as e:
+            logger.error("tmux send-keys failed for pane %s: %s", pane_id, e)
+            return False
+        except OSError:
+            logger.warning("tmux control connection for pane %s lost, falling back to send-keys", pane_id)
 
     try:
-        # Step 1: Send text literally in chunks (-l prevents key name interpretation)
-        _send_text_chunked(pane_id, text)
-        # Wait for TUI to render the input text before pressing Enter
-        time.sleep(0.5)
-        # Step 2: Send Enter key separately (without -l so "Enter" is a key name)
-        subprocess.run(
-            ["tmux", "send-keys", "-t", pane_id, "Enter"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        await _run_tmux(build_inject_args(pane_id, text))
         return True
     except subprocess.CalledProcessError as e:
-        logger.error("tmux send-keys failed for pane %s: %s", pane_id, e.stderr.strip())
+        logger.error("tmux send-keys failed for pane %s: %s", pane_id, e.stderr.decode(errors="replace").strip())
         return False
     except FileNotFoundError:
         logger.error("tmux binary not found")
         return False
 
 
-def inject_messages(pane_id: str, messages: list[InboxMessage]) -> int:
+async def inject_messages(
+    pane_id: str,
+    messages: list[InboxMessage],
+    sender: PersistentTmuxSender | None = None,
+) -> int:
     """Inject multiple messages into a tmux pane.
 
-    Returns the number of successfully injected messages.
+    All messages are joined by blank lines and submitted as a single turn,
+    so the agent handles them together instead of taking one turn per message.
+
+    Returns the number of successfully injected messages (all or none).
     """
-    count = 0
-    for msg in messages:
-        if inject_message(pane_id, msg):
-            count += 1
-        else:
-            logger.warning("Stopping injection after failure at message %d/%d", count + 1, len(messages))
-            break
-    return count
+    if not messages:
+        return 0
+    combined = "\n\n".join(format_message_for_injection(m) for m in messages)
+    return len(messages) if await inject_message(pane_id, combined, sender) else 0
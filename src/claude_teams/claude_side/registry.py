@@ -12,22 +12,33 @@ from pathlib import Path
 import time
 
 from claude_teams.common import messaging, teams
-from claude_teams.common.models import COLOR_PALETTE, TeammateMember
+from claude_teams.common.models import COLOR_PALETTE, LeadMember, TeamConfig, TeammateMember
 from claude_teams.common.teams import _VALID_NAME_RE
 
 # In-memory registry: tracks (team_name, agent_name) pairs that are external.
 # Populated at registration time; cleared on unregister or server restart.
 _external_agents: set[tuple[str, str]] = set()
 
+_MAX_NAME_LEN = 64
+
 
 def is_external(team_name: str, agent_name: str) -> bool:
     """Check if an agent is tracked as external in this server's memory."""
     return (team_name, agent_name) in _external_agents
 
 
-def _next_color(team_name: str, base_dir: Path | None = None) -> str:
-    """Pick the next color from the palette based on current member count."""
-    config = teams.read_config(team_name, base_dir)
+def validate_agent_name(name: str) -> None:
+    """Raise ValueError unless `name` is usable for a new external agent."""
+    if name == "team-lead":
+        raise ValueError("Agent name 'team-lead' is reserved")
+    if len(name) > _MAX_NAME_LEN:
+        raise ValueError(f"Agent name too long ({len(name)} chars, max {_MAX_NAME_LEN})")
+    if not _VALID_NAME_RE.match(name):
+        raise ValueError(f"Invalid agent name: {name!r}. Use only letters, numbers, hyphens, underscores.")
+
+
+def _next_color(config: TeamConfig) -> str:
+    """Pick the next color from the palette based on the config's teammate count."""
     count = sum(1 for m in config.members if isinstance(m, TeammateMember))
     return COLOR_PALETTE[count % len(COLOR_PALETTE)]
 
@@ -49,21 +60,35 @@ def register_external_agent(
 
     Raises ValueError if the name already exists in the team or is invalid.
     """
-    if not _VALID_NAME_RE.match(name):
-        raise ValueError(f"Invalid agent name: {name!r}. Use only letters, numbers, hyphens, underscores.")
-    if len(name) > 64:
-        raise ValueError(f"Agent name too long ({len(name)} chars, max 64)")
-    if name == "team-lead":
-        raise ValueError("Agent name 'team-lead' is reserved")
-    color = _next_color(team_name, base_dir)
-    now_ms = int(time.time() * 1000)
+    member, _ = register_external_agent_with_roster(
+        team_name, name, agent_type=agent_type, cwd=cwd, prompt=prompt, base_dir=base_dir
+    )
+    return member
+
+
+def register_external_agent_with_roster(
+    team_name: str,
+    name: str,
+    *,
+    agent_type: str = "general-purpose",
+    cwd: str = "",
+    prompt: str = "",
+    base_dir: Path | None = None,
+) -> tuple[TeammateMember, list[LeadMember | TeammateMember]]:
+    """Like `register_external_agent`, but also return the team's members as written.
+
+    The member list comes from the same locked read-modify-write that added
+    the agent, so callers need not re-read config.json.
+    """
+    validate_agent_name(name)
+    now_ms = time.time_ns() // 1_000_000
 
     member = TeammateMember(
         agent_id=f"{name}@{team_name}",
         name=name,
         agent_type=agent_type,
         prompt=prompt,
-        color=color,
+        color=COLOR_PALETTE[0],
         plan_mode_required=False,
         joined_at=now_ms,
         tmux_pane_id="",
@@ -72,12 +97,18 @@ def register_external_agent(
         is_active=False,
     )
 
-    # add_member raises ValueError if name already exists
-    teams.add_member(team_name, member, base_dir)
+    def add(config: TeamConfig) -> list[LeadMember | TeammateMember]:
+        # Color and duplicate check see the same locked config, so concurrent
+        # registrations neither clobber each other nor share a color.
+        member.color = _next_color(config)
+        teams.append_member(config, member)
+        return list(config.members)
+
+    members = teams.transact(team_name, add, base_dir)
     messaging.ensure_inbox(team_name, name, base_dir)
 
     _external_agents.add((team_name, name))
-    return member
+    return member, members
 
 
 def unregister_external_agent(
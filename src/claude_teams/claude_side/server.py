@@ -7,8 +7,9 @@ Claude Code handles team creation, messaging, and task management natively.
 This server only bridges external agents into the native team system.
 """
 
+import asyncio
 import logging
-from pathlib import PurePath
+from pathlib import Path, PurePath
 
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
@@ -16,8 +17,14 @@ from fastmcp.server.lifespan import lifespan
 
 from claude_teams.claude_side import watcher
 from claude_teams.claude_side.registry import is_external, unregister_external_agent
-from claude_teams.claude_side.spawner import BackendType, discover_backend_binaries, kill_tmux_pane, spawn_external
-from claude_teams.claude_side.tmux_introspection import peek_pane, resolve_pane_target
+from claude_teams.claude_side.spawner import (
+    BackendType,
+    discover_backend_binaries,
+    kill_tmux_pane,
+    kill_tmux_panes,
+    spawn_external,
+)
+from claude_teams.claude_side.tmux_introspection import forget_pane_target, peek_pane, resolve_pane_target
 from claude_teams.common import tasks, teams
 from claude_teams.common.models import SpawnResult, TeammateMember
 
@@ -35,7 +42,7 @@ async def app_lifespan(server):
     try:
         yield {"binaries": binaries}
     finally:
-        stopped = watcher.stop_all_watchers()
+        stopped = await watcher.drain_watchers()
         if stopped:
             logger.info("Stopped %d inbox watcher(s) on server shutdown", stopped)
 
@@ -60,14 +67,13 @@ def _find_external_teammate(team_name: str, name: str) -> TeammateMember:
     Raises ToolError if team not found, agent not found, or agent is not external.
     """
     try:
-        config = teams.read_config(team_name)
+        member = teams.get_member(team_name, name)
     except FileNotFoundError:
         raise ToolError(f"Team {team_name!r} not found")
     if not is_external(team_name, name):
         raise ToolError(f"Agent {name!r} is not tracked as an external agent in this server.")
-    for m in config.members:
-        if isinstance(m, TeammateMember) and m.name == name:
-            return m
+    if isinstance(member, TeammateMember):
+        return member
     raise ToolError(f"External agent {name!r} not found in team {team_name!r}")
 
 
@@ -89,15 +95,21 @@ async def spawn_external_agent(
     Args:
         backend_type: CLI backend to use. Currently supported: "codex".
         subagent_type: Role description for the agent (e.g., "code-reviewer").
-        cwd: Working directory (must be an absolute path).
+        cwd: Working directory (must be an absolute path to an existing directory).
 
     Names must be unique within the team.
     """
+    # Checked before spawn_external so a bad cwd never touches config.json or the inbox.
     if not PurePath(cwd).is_absolute():
         raise ToolError("cwd must be an absolute path.")
+    if not Path(cwd).is_dir():
+        raise ToolError(f"cwd does not exist or is not a directory: {cwd}")
     binaries: dict[str, str] = ctx.lifespan_context.get("binaries", {})
     try:
-        member = spawn_external(
+        # spawn_external blocks on file I/O and tmux; run it off the event loop
+        # so concurrent spawns (and watcher injections) overlap.
+        member = await asyncio.to_thread(
+            spawn_external,
             team_name=team_name,
             name=name,
             prompt=prompt,
@@ -123,14 +135,16 @@ async def spawn_external_agent(
     ).model_dump()
 
 
-def _check_tmux_status(pane_id_raw: str, include_output: bool, output_lines: int) -> dict:
+async def _check_tmux_status(pane_id_raw: str, include_output: bool, output_lines: int) -> dict:
     """Check tmux pane status and optionally capture output."""
     if not pane_id_raw:
         return {"alive": False, "error": "no tmux target recorded", "output": ""}
-    pane_id, resolve_error = resolve_pane_target(pane_id_raw)
+    pane_id, resolve_error = await resolve_pane_target(pane_id_raw)
     if pane_id is None:
         return {"alive": False, "error": resolve_error, "output": ""}
-    pane = peek_pane(pane_id, output_lines if include_output else 1)
+    pane = await peek_pane(pane_id, output_lines if include_output else 0)
+    if pane["error"]:
+        forget_pane_target(pane_id_raw)
     return {
         "alive": pane["alive"],
         "error": pane["error"],
@@ -150,7 +164,7 @@ async def check_external_agent(
     Always non-blocking. Use parallel calls to check multiple agents."""
     output_lines = max(1, min(output_lines, 120))
     member = _find_external_teammate(team_name, agent_name)
-    tmux = _check_tmux_status(member.tmux_pane_id, include_output, output_lines)
+    tmux = await _check_tmux_status(member.tmux_pane_id, include_output, output_lines)
 
     result: dict = {
         "name": agent_name,
@@ -168,23 +182,52 @@ async def check_external_agent(
 
 
 @mcp.tool
-def shutdown_external_agent(team_name: str, agent_name: str) -> dict:
+async def shutdown_external_agent(team_name: str, agent_name: str) -> dict:
     """Shut down an external agent by killing its tmux pane/window,
     stopping its inbox watcher, removing it from team config, and resetting its tasks."""
     if agent_name == "team-lead":
         raise ToolError("Cannot shut down team-lead")
     member = _find_external_teammate(team_name, agent_name)
 
-    # Stop inbox watcher first
+    # Stop inbox watcher first (watcher tasks belong to the event loop, so not from a worker thread)
     watcher.stop_watcher(team_name, agent_name)
 
-    if member.tmux_pane_id:
-        kill_tmux_pane(member.tmux_pane_id)
-    unregister_external_agent(team_name, agent_name)
-    tasks.reset_owner_tasks(team_name, agent_name)
+    def teardown() -> None:
+        if member.tmux_pane_id:
+            kill_tmux_pane(member.tmux_pane_id)
+        unregister_external_agent(team_name, agent_name)
+        tasks.reset_owner_tasks(team_name, agent_name)
+
+    await asyncio.to_thread(teardown)
     return {"success": True, "message": f"{agent_name} has been stopped and removed from team."}
 
 
+@mcp.tool
+async def shutdown_all_external_agents(team_name: str) -> dict:
+    """Shut down every external agent in a team at once (e.g. before deleting the team).
+
+    Same as calling shutdown_external_agent for each of them, but all
+    tmux panes/windows are killed with a single tmux invocation."""
+    try:
+        config = await asyncio.to_thread(teams.read_config, team_name)
+    except FileNotFoundError:
+        raise ToolError(f"Team {team_name!r} not found") from None
+    members = [m for m in config.members if isinstance(m, TeammateMember) and is_external(team_name, m.name)]
+
+    for m in members:
+        watcher.stop_watcher(team_name, m.name)
+
+    def teardown() -> None:
+        kill_tmux_panes([m.tmux_pane_id for m in members if m.tmux_pane_id])
+        for m in members:
+            unregister_external_agent(team_name, m.name)
+            tasks.reset_owner_tasks(team_name, m.name)
+
+    await asyncio.to_thread(teardown)
+    names = [m.name for m in members]
+    return {"success": True, "stopped": names, "message": f"Stopped {len(names)} external agent(s)."}
+
+
 def main():
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     mcp.run()
@@ -7,17 +7,22 @@ build_spawn_command / wrap_prompt / discover_backend_binaries.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 import os
 from pathlib import Path
-import shlex
+import re
 import shutil
 import subprocess
 from typing import Literal
 
-from claude_teams.claude_side.registry import register_external_agent, unregister_external_agent
+from claude_teams.claude_side.registry import (
+    register_external_agent_with_roster,
+    unregister_external_agent,
+    validate_agent_name,
+)
+from claude_teams.claude_side.tmux_introspection import TMUX_BINARY, escape_tmux_arg, forget_pane_target
 from claude_teams.common import teams
-from claude_teams.common.models import TeammateMember
-from claude_teams.common.teams import _VALID_NAME_RE
+from claude_teams.common.models import LeadMember, TeammateMember
 
 # ---------------------------------------------------------------------------
 # Backend type definition
@@ -28,6 +33,15 @@ BackendType = Literal["codex", "gemini"]
 _CODEX_BINARY_NAME = "codex"
 _GEMINI_BINARY_NAME = "gemini"
 
+# backend -> (binary name on PATH, env var that pins its path)
+_BACKEND_BINARIES: dict[str, tuple[str, str]] = {
+    "codex": (_CODEX_BINARY_NAME, "CLAUDE_TEAMS_CODEX_BIN"),
+    "gemini": (_GEMINI_BINARY_NAME, "CLAUDE_TEAMS_GEMINI_BIN"),
+}
+
+# Last discovery result, keyed by the PATH and pinned paths it was computed from.
+_binary_cache: tuple[tuple[str, tuple[str | None, ...]], dict[str, str]] | None = None
+
 # ---------------------------------------------------------------------------
 # Prompt template
 # ---------------------------------------------------------------------------
@@ -57,14 +71,16 @@ Use MCP tools from the 'claude-teams-external' server:
 
 {prompt}"""
 
+# The template split into alternating literal / field-name segments, so
+# wrap_prompt can join it without re-parsing the format string each spawn.
+_CODEX_PROMPT_PARTS: tuple[str, ...] = tuple(re.split(r"\{(\w+)\}", _CODEX_PROMPT_TEMPLATE))
+
 
-def _format_teammates_section(teammates: list[dict[str, str]]) -> str:
-    """Format the team members section for the prompt."""
-    if not teammates:
+def _format_teammates_section(members: Sequence[LeadMember | TeammateMember], self_name: str) -> str:
+    """Format the team members section for the prompt, leaving out `self_name`."""
+    lines = [f"- {m.name} ({m.agent_type})" for m in members if m.name != self_name]
+    if not lines:
         return "(no other teammates yet)"
-    lines = []
-    for t in teammates:
-        lines.append(f"- {t['name']} ({t['agentType']})")
     return "\n".join(lines)
 
 
@@ -74,21 +90,24 @@ def wrap_prompt(
     team_name: str,
     prompt: str,
     agent_type: str = "general-purpose",
-    teammates: list[dict[str, str]] | None = None,
+    members: Sequence[LeadMember | TeammateMember] = (),
 ) -> str:
-    """Wrap a raw prompt with team context for the given backend."""
+    """Wrap a raw prompt with team context for the given backend.
+
+    `members` is the team's member list; the agent being spawned is skipped.
+    """
     if backend_type in ("codex", "gemini"):
-        template = _CODEX_PROMPT_TEMPLATE
+        parts = _CODEX_PROMPT_PARTS
     else:
         raise ValueError(f"Unknown backend type: {backend_type!r}")
-    teammates_section = _format_teammates_section(teammates or [])
-    return template.format(
-        name=name,
-        team_name=team_name,
-        agent_type=agent_type,
-        teammates_section=teammates_section,
-        prompt=prompt,
-    )
+    fields = {
+        "name": name,
+        "team_name": team_name,
+        "agent_type": agent_type,
+        "teammates_section": _format_teammates_section(members, name),
+        "prompt": prompt,
+    }
+    return "".join(fields[part] if i % 2 else part for i, part in enumerate(parts))
 
 
 # ---------------------------------------------------------------------------
@@ -96,24 +115,16 @@ def wrap_prompt(
 # ---------------------------------------------------------------------------
 
 
-def build_spawn_command(backend_type: BackendType, binary: str, prompt: str, cwd: str) -> str:
-    """Build the shell command to spawn an external agent."""
+def build_spawn_command(backend_type: BackendType, binary: str, prompt: str) -> list[str]:
+    """Build the argv that starts an external agent.
+
+    tmux execs the argv directly (no shell), so nothing needs quoting; the
+    working directory is set by tmux itself (see build_tmux_spawn_args).
+    """
     if backend_type == "codex":
-        return (
-            f"cd {shlex.quote(cwd)} && "
-            f"{shlex.quote(binary)} "
-            f"--dangerously-bypass-approvals-and-sandbox "
-            f"--no-alt-screen "
-            f"{shlex.quote(prompt)}"
-        )
+        return [binary, "--dangerously-bypass-approvals-and-sandbox", "--no-alt-screen", prompt]
     if backend_type == "gemini":
-        return (
-            f"cd {shlex.quote(cwd)} && "
-            f"{shlex.quote(binary)} "
-            f"--yolo "
-            f"--screen-reader "
-            f"--prompt-interactive {shlex.quote(prompt)}"
-        )
+        return [binary, "--yolo", "--screen-reader", "--prompt-interactive", prompt]
     raise ValueError(f"Unknown backend type: {backend_type!r}")
 
 
@@ -123,15 +134,24 @@ def build_spawn_command(backend_type: BackendType, binary: str, prompt: str, cwd
 
 
 def discover_backend_binaries() -> dict[str, str]:
-    """Discover available backend binaries on PATH."""
+    """Discover available backend binaries.
+
+    A path pinned via CLAUDE_TEAMS_CODEX_BIN / CLAUDE_TEAMS_GEMINI_BIN is
+    used as-is; otherwise the binary is looked up on PATH. The result is
+    reused until PATH or a pinned path changes.
+    """
+    global _binary_cache
+    pinned = {backend: os.environ.get(var) for backend, (_, var) in _BACKEND_BINARIES.items()}
+    key = (os.environ.get("PATH", ""), tuple(pinned.values()))
+    if _binary_cache is not None and _binary_cache[0] == key:
+        return dict(_binary_cache[1])
     found: dict[str, str] = {}
-    path = shutil.which(_CODEX_BINARY_NAME)
-    if path:
-        found["codex"] = path
-    path = shutil.which(_GEMINI_BINARY_NAME)
-    if path:
-        found["gemini"] = path
-    return found
+    for backend, (binary_name, _) in _BACKEND_BINARIES.items():
+        path = pinned[backend] or shutil.which(binary_name)
+        if path:
+            found[backend] = path
+    _binary_cache = (key, found)
+    return dict(found)
 
 
 def use_tmux_windows() -> bool:
@@ -142,60 +162,61 @@ def use_tmux_windows() -> bool:
 def _has_tmux_session() -> bool:
     """Return True if the tmux server is running and has at least one session."""
     result = subprocess.run(
-        ["tmux", "list-sessions"],
-        capture_output=True,
-        text=True,
+        [TMUX_BINARY, "list-sessions"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0 and bool(result.stdout.strip())
 
 
-def build_tmux_spawn_args(command: str, name: str) -> list[str]:
-    """Build the tmux command used to spawn a teammate process.
+def build_tmux_spawn_args(command: list[str], name: str, cwd: str) -> list[str]:
+    """Build the tmux command used to spawn a teammate process in `cwd`.
 
     Chooses the strategy based on environment:
     - USE_TMUX_WINDOWS set → ``tmux new-window``
     - Active tmux session exists → ``tmux split-window``
     - No session at all → ``tmux new-session -d`` (creates a detached session)
     """
+    # tmux would read a trailing ';' in any argument as a command separator.
+    argv = [escape_tmux_arg(a) for a in command]
     if use_tmux_windows():
         return [
-            "tmux",
+            TMUX_BINARY,
             "new-window",
             "-dP",
             "-F",
             "#{window_id}",
+            "-c",
+            cwd,
             "-n",
             f"@claude-team | {name}",
-            command,
+            *argv,
         ]
     if _has_tmux_session():
-        return ["tmux", "split-window", "-dP", "-F", "#{pane_id}", command]
+        return [TMUX_BINARY, "split-window", "-dP", "-F", "#{pane_id}", "-c", cwd, *argv]
     # No tmux session — create a detached session so the agent has somewhere to live.
     session_name = f"claude-agent-{name}"
     return [
-        "tmux",
+        TMUX_BINARY,
         "new-session",
         "-d",
         "-s",
         session_name,
+        "-c",
+        cwd,
         "-x",
         "200",
         "-y",
         "50",
         "-PF",
         "#{pane_id}",
-        command,
+        *argv,
     ]
 
 
 def _validate_spawn_args(name: str, binary: str | None, backend_type: BackendType) -> None:
     """Validate spawn_external arguments, raising ValueError on failure."""
-    if not _VALID_NAME_RE.match(name):
-        raise ValueError(f"Invalid agent name: {name!r}. Use only letters, numbers, hyphens, underscores.")
-    if len(name) > 64:
-        raise ValueError(f"Agent name too long ({len(name)} chars, max 64)")
-    if name == "team-lead":
-        raise ValueError("Agent name 'team-lead' is reserved")
+    validate_agent_name(name)
     if not binary:
         raise ValueError(f"Cannot spawn {backend_type} teammate: binary not found on PATH.")
 
@@ -231,7 +252,7 @@ def spawn_external(
     resolved_cwd = cwd or str(Path.cwd())
 
     # Step 1: Register in team config + create inbox
-    member = register_external_agent(
+    member, members = register_external_agent_with_roster(
         team_name,
         name,
         agent_type=subagent_type,
@@ -243,36 +264,28 @@ def spawn_external(
     spawned_pane_id: str | None = None
     try:
         # Step 2: Spawn process in tmux
-        config = teams.read_config(team_name, base_dir)
-        teammates = [
-            {"name": m.name, "agentType": m.agent_type}
-            for m in config.members
-            if m.name != name  # exclude self
-        ]
         wrapped = wrap_prompt(
             backend_type,
             name,
             team_name,
             prompt,
             agent_type=subagent_type,
-            teammates=teammates,
-        )
-        cmd = build_spawn_command(backend_type, binary, wrapped, resolved_cwd)
-        result = subprocess.run(
-            build_tmux_spawn_args(cmd, name),
-            capture_output=True,
-            text=True,
-            check=True,
+            members=members,
         )
-        spawned_pane_id = result.stdout.strip()
+        cmd = build_spawn_command(backend_type, binary, wrapped)
+        try:
+            result = subprocess.run(
+                build_tmux_spawn_args(cmd, name, resolved_cwd),
+                capture_output=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = (e.stderr or b"").decode(errors="replace").strip()
+            raise RuntimeError(f"tmux failed to start the agent: {stderr or e}") from e
+        spawned_pane_id = result.stdout.decode().strip()
 
         # Step 3: Update config with pane ID
-        config = teams.read_config(team_name, base_dir)
-        for m in config.members:
-            if isinstance(m, TeammateMember) and m.name == name:
-                m.tmux_pane_id = spawned_pane_id
-                break
-        teams.write_config(team_name, config, base_dir)
+        teams.update_member(team_name, name, base_dir, tmux_pane_id=spawned_pane_id)
     except Exception:
         # Rollback: kill orphan pane (if spawned) and unregister
         if spawned_pane_id:
@@ -292,8 +305,36 @@ def spawn_external(
     return member
 
 
+def _kill_command(pane_id: str) -> list[str]:
+    return ["kill-window" if pane_id.startswith("@") else "kill-pane", "-t", pane_id]
+
+
 def kill_tmux_pane(pane_id: str) -> None:
-    if pane_id.startswith("@"):
-        subprocess.run(["tmux", "kill-window", "-t", pane_id], check=False)
+    forget_pane_target(pane_id)
+    subprocess.run(
+        [TMUX_BINARY, *_kill_command(pane_id)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+
+def kill_tmux_panes(pane_ids: list[str]) -> None:
+    """Kill several panes/windows with a single tmux invocation.
+
+    tmux abandons a command sequence at the first failure (e.g. a pane that
+    has already exited), so if the batch fails each target is killed on its own.
+    """
+    if not pane_ids:
         return
-    subprocess.run(["tmux", "kill-pane", "-t", pane_id], check=False)
+    for pane_id in pane_ids:
+        forget_pane_target(pane_id)
+    args = [TMUX_BINARY]
+    for i, pane_id in enumerate(pane_ids):
+        if i:
+            args.append(";")
+        args += _kill_command(pane_id)
+    result = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    if result.returncode != 0:
+        for pane_id in pane_ids:
+            kill_tmux_pane(pane_id)
@@ -6,10 +6,82 @@ without modifying any tmux state.
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import shutil
+import time
 
+# Resolved once so hot paths (injection, status checks) skip the PATH search
+# on every exec. Falls back to the bare name so a missing tmux still surfaces
+# as FileNotFoundError at call time.
+TMUX_BINARY = shutil.which("tmux") or "tmux"
 
-def resolve_pane_target(tmux_target: str) -> tuple[str | None, str | None]:
+
+def escape_tmux_arg(arg: str) -> str:
+    """Keep tmux from reading a trailing ';' in an argv element as a command separator."""
+    if arg.endswith(";"):
+        return arg[:-1] + "\\;"
+    return arg
+
+
+# Window target -> (monotonic expiry, resolved pane id). A window's active
+# pane rarely changes, so polling callers reuse the answer for a short while.
+_PANE_RESOLVE_TTL = 2.0
+_pane_resolve_cache: dict[str, tuple[float, str]] = {}
+
+# The in-flight `list-panes -a`, shared so concurrent lookups of any number
+# of windows cost a single tmux call.
+_window_refresh: asyncio.Task[str | None] | None = None
+
+
+async def _tmux(*args: str) -> tuple[int, str, str]:
+    """Run a tmux command without blocking the event loop; return (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        TMUX_BINARY,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    assert proc.returncode is not None
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def _refresh_window_panes() -> str | None:
+    """Cache the active pane of every tmux window; return an error message on failure."""
+    returncode, stdout, stderr = await _tmux("list-panes", "-a", "-F", "#{window_id}\t#{pane_id}\t#{pane_active}")
+    if returncode != 0:
+        return stderr.strip() or "tmux list-panes failed"
+    panes: dict[str, str] = {}
+    for line in stdout.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 3:
+            continue
+        window_id, pane_id, active = parts
+        # Prefer the active pane; fall back to first pane
+        if active == "1" or window_id not in panes:
+            panes[window_id] = pane_id
+    expiry = time.monotonic() + _PANE_RESOLVE_TTL
+    # The listing covers every window, so anything missing from it is gone
+    _pane_resolve_cache.clear()
+    _pane_resolve_cache.update({window_id: (expiry, pane_id) for window_id, pane_id in panes.items()})
+    return None
+
+
+async def _shared_window_refresh() -> str | None:
+    global _window_refresh
+    task = _window_refresh
+    if task is None or task.done():
+        task = _window_refresh = asyncio.create_task(_refresh_window_panes())
+    # Shielded so one cancelled caller doesn't abort the refresh for the others
+    return await asyncio.shield(task)
+
+
+def forget_pane_target(tmux_target: str) -> None:
+    """Drop any cached resolution for `tmux_target` (e.g. after killing it)."""
+    _pane_resolve_cache.pop(tmux_target, None)
+
+
+async def resolve_pane_target(tmux_target: str) -> tuple[str | None, str | None]:
     """Resolve a stored tmux target to an effective pane ID.
 
     Returns (pane_id, error). If pane_id is None, error explains why.
@@ -17,6 +89,7 @@ def resolve_pane_target(tmux_target: str) -> tuple[str | None, str | None]:
     - If target starts with '%': use as-is (it's a pane ID)
     - If target starts with '@': it's a window ID, resolve via
       tmux list-panes to find the active pane, fallback to first pane.
+      All windows are listed in one call and cached together.
     - If target is empty: return (None, "no tmux target recorded")
     """
     if not tmux_target:
@@ -26,65 +99,53 @@ def resolve_pane_target(tmux_target: str) -> tuple[str | None, str | None]:
         return tmux_target, None
 
     if tmux_target.startswith("@"):
-        result = subprocess.run(
-            ["tmux", "list-panes", "-t", tmux_target, "-F", "#{pane_id}\t#{pane_active}"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return None, result.stderr.strip() or "tmux target not found"
-        lines = [line for line in result.stdout.strip().splitlines() if line]
-        if not lines:
-            return None, "no panes found for window"
-        # Prefer the active pane; fall back to first pane
-        for line in lines:
-            parts = line.split("\t", 1)
-            if len(parts) == 2 and parts[1] == "1":
-                return parts[0], None
-        return lines[0].split("\t", 1)[0], None
+        cached = _pane_resolve_cache.get(tmux_target)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1], None
+        error = await _shared_window_refresh()
+        cached = _pane_resolve_cache.get(tmux_target)
+        if error is not None or cached is None:
+            forget_pane_target(tmux_target)
+            return None, error or f"can't find window: {tmux_target}"
+        return cached[1], None
 
     # Unknown format, try using as-is
     return tmux_target, None
 
 
-def peek_pane(pane_id: str, lines: int) -> dict:
+async def peek_pane(pane_id: str, lines: int) -> dict:
     """Capture status and output from a tmux pane.
 
+    The liveness check and the capture run as one tmux command sequence:
+    the first output line is #{pane_dead}, the rest is the captured text.
+    With `lines=0` only the liveness check runs.
+
     Returns dict with keys: alive, output, error.
     """
-    # Step 1: check if pane is dead
-    status_result = subprocess.run(
-        ["tmux", "display-message", "-p", "-t", pane_id, "#{pane_dead}"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if status_result.returncode != 0:
+    args = ["display-message", "-p", "-t", pane_id, "#{pane_dead}"]
+    if lines > 0:
+        args += [";", "capture-pane", "-p", "-t", pane_id, "-S", f"-{lines}", "-J"]
+    returncode, stdout, stderr = await _tmux(*args)
+    status, _, output = stdout.partition("\n")
+    status = status.strip()
+    if status not in ("0", "1"):
+        # display-message failed, so tmux skipped the capture as well
         return {
             "alive": False,
             "output": "",
-            "error": status_result.stderr.strip() or "tmux target not found",
+            "error": stderr.strip() or "tmux target not found",
         }
 
-    alive = status_result.stdout.strip() != "1"
-
-    # Step 2: capture pane output
-    capture_result = subprocess.run(
-        ["tmux", "capture-pane", "-p", "-t", pane_id, "-S", f"-{lines}", "-J"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if capture_result.returncode != 0:
+    alive = status != "1"
+    if returncode != 0:
         return {
             "alive": alive,
             "output": "",
-            "error": capture_result.stderr.strip() or "capture-pane failed",
+            "error": stderr.strip() or "capture-pane failed",
         }
 
     return {
         "alive": alive,
-        "output": capture_result.stdout.rstrip(),
+        "output": output.rstrip(),
         "error": None,
     }
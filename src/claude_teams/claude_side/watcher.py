@@ -4,16 +4,23 @@ Monitors inbox files of external (non-Claude) agents for new unread messages.
 When new messages are detected, they are read (marked as read) and injected
 into the agent's tmux pane via the injector module.
 
-Each external agent gets its own watcher task managed via asyncio.
+Each external agent gets its own watcher task managed via asyncio. The tasks
+sleep until a shared per-directory file watcher (inotify/FSEvents via
+watchfiles) reports a change to their inbox file. Set
+WATCHFILES_FORCE_POLLING=1 on filesystems without change notifications
+(NFS, CIFS).
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from pathlib import Path
 
-from claude_teams.claude_side.injector import inject_messages
+from watchfiles import awatch
+
+from claude_teams.claude_side.injector import PersistentTmuxSender, inject_messages
 from claude_teams.common import messaging
 
 logger = logging.getLogger(__name__)
@@ -21,8 +28,165 @@ logger = logging.getLogger(__name__)
 # Active watcher tasks keyed by (team_name, agent_name)
 _watchers: dict[tuple[str, str], asyncio.Task] = {}
 
-# Poll interval in seconds
-_POLL_INTERVAL = 1.0
+# Persistent tmux control connections keyed by pane_id, with the watcher task
+# that last used each one (only that task may close it)
+_senders: dict[str, tuple[asyncio.Task | None, PersistentTmuxSender]] = {}
+
+# Inbox directory -> inbox file name -> wake-up event of the agent watching it
+_wakeups: dict[Path, dict[str, asyncio.Event]] = {}
+
+# Directory watcher tasks and their stop events, keyed by inbox directory
+_dir_watchers: dict[Path, tuple[asyncio.Task, asyncio.Event]] = {}
+
+# Seconds before retrying a failed injection, and the longest a watcher sleeps
+# without a change event before re-checking its inbox anyway.
+_RETRY_INTERVAL = 1.0
+_RESCAN_INTERVAL = 30.0
+
+# Consecutive failed deliveries after which a watcher gives up on its pane
+# (about this many seconds of retries, at _RETRY_INTERVAL apart).
+_MAX_DELIVERY_FAILURES = 30
+
+
+async def _get_sender(pane_id: str) -> PersistentTmuxSender | None:
+    """Return a live control connection for the pane, opening one if needed.
+
+    Returns None if tmux refuses the connection; callers then fall back
+    to one-shot send-keys invocations.
+    """
+    entry = _senders.get(pane_id)
+    if entry is not None and not entry[1].closed:
+        sender = entry[1]
+    else:
+        if entry is not None:
+            await entry[1].aclose()
+        try:
+            sender = await PersistentTmuxSender.open(pane_id)
+        except OSError as e:
+            logger.debug("No tmux control connection for pane %s: %s", pane_id, e)
+            _senders.pop(pane_id, None)
+            return None
+    _senders[pane_id] = (asyncio.current_task(), sender)
+    return sender
+
+
+async def _close_sender(pane_id: str) -> None:
+    """Close the pane's control connection unless a newer watcher has taken it over."""
+    entry = _senders.get(pane_id)
+    if entry is None or entry[0] is not asyncio.current_task():
+        return
+    del _senders[pane_id]
+    await entry[1].aclose()
+
+
+async def _watch_dir(directory: Path, stop: asyncio.Event) -> None:
+    """Wake the agents subscribed to `directory` when their inbox file changes.
+
+    If even polling fails, the error is logged and watching is retried with
+    a growing delay; subscribers are woken on every retry meanwhile, so they
+    keep checking their inboxes while change events are unavailable.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    force_polling: bool | None = None  # None lets watchfiles read WATCHFILES_FORCE_POLLING
+    delay = _RETRY_INTERVAL
+    while not stop.is_set():
+        try:
+            async for changes in awatch(
+                directory, watch_filter=None, stop_event=stop, recursive=False, force_polling=force_polling
+            ):
+                delay = _RETRY_INTERVAL
+                events = _wakeups.get(directory, {})
+                for _, path in changes:
+                    event = events.get(Path(path).name)
+                    if event is not None:
+                        event.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if not force_polling:
+                logger.warning("Cannot watch %s natively, falling back to polling", directory, exc_info=True)
+                force_polling = True
+                continue
+            logger.exception("Watching %s failed, retrying in %.1fs", directory, delay)
+            for event in _wakeups.get(directory, {}).values():
+                event.set()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), delay)
+            delay = min(delay * 2, _RESCAN_INTERVAL)
+
+
+def _subscribe(inbox: Path) -> asyncio.Event:
+    """Register for change events on `inbox`, starting its directory watcher if needed."""
+    event = asyncio.Event()
+    directory = inbox.parent
+    _wakeups.setdefault(directory, {})[inbox.name] = event
+    running = _dir_watchers.get(directory)
+    if running is None or running[0].done():
+        stop = asyncio.Event()
+        task = asyncio.create_task(_watch_dir(directory, stop), name=f"inbox-watch-{directory}")
+        _dir_watchers[directory] = (task, stop)
+    return event
+
+
+def _unsubscribe(inbox: Path, event: asyncio.Event) -> None:
+    """Undo `_subscribe`; the directory watcher stops with its last subscriber."""
+    directory = inbox.parent
+    events = _wakeups.get(directory)
+    if events is None or events.get(inbox.name) is not event:
+        return  # already replaced by a newer watcher for the same agent
+    del events[inbox.name]
+    if not events:
+        del _wakeups[directory]
+        running = _dir_watchers.pop(directory, None)
+        if running is not None:
+            running[1].set()
+
+
+async def _deliver_unread(team_name: str, agent_name: str, pane_id: str, base_dir: Path | None) -> bool:
+    """Inject the agent's unread messages; return True if all of them were delivered.
+
+    Inbox I/O runs in a worker thread, so a slow filesystem or a wait on the
+    inbox lock doesn't stall the event loop.
+    """
+    new_msgs = await asyncio.to_thread(
+        messaging.read_inbox,
+        team_name,
+        agent_name,
+        unread_only=True,
+        mark_as_read=False,
+        base_dir=base_dir,
+    )
+    if not new_msgs:
+        return True
+    logger.info(
+        "Injecting %d message(s) to %s@%s",
+        len(new_msgs),
+        agent_name,
+        team_name,
+    )
+    sender = await _get_sender(pane_id)
+    injected = await inject_messages(pane_id, new_msgs, sender=sender)
+    if injected > 0:
+        await asyncio.to_thread(messaging.mark_messages_as_read, team_name, agent_name, injected, base_dir)
+    if injected < len(new_msgs):
+        logger.warning(
+            "Only %d/%d message(s) injected for %s@%s, will retry",
+            injected,
+            len(new_msgs),
+            agent_name,
+            team_name,
+        )
+        return False
+    return True
+
+
+def _inbox_stamp(inbox: Path) -> tuple[int, int] | None:
+    """Return the inbox's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        st = inbox.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 async def _watch_loop(
@@ -31,57 +195,53 @@ async def _watch_loop(
     pane_id: str,
     base_dir: Path | None = None,
 ) -> None:
-    """Poll an agent's inbox file for new unread messages and inject them."""
+    """Inject new unread messages from an agent's inbox file as it changes."""
     inbox = messaging.inbox_path(team_name, agent_name, base_dir)
-    last_mtime: float = 0
+    wakeup = _subscribe(inbox)
+    # (mtime_ns, size) of the inbox as last fully handled
+    last_stamp: tuple[int, int] | None = None
+    failures = 0
 
     logger.info("Watcher started for %s@%s (pane=%s)", agent_name, team_name, pane_id)
 
     try:
         while True:
+            wakeup.clear()
+            retry = False
             try:
-                if inbox.exists():
-                    current_mtime = inbox.stat().st_mtime
-                    if current_mtime > last_mtime:
-                        new_msgs = messaging.read_inbox(
-                            team_name,
-                            agent_name,
-                            unread_only=True,
-                            mark_as_read=False,
-                            base_dir=base_dir,
-                        )
-                        if new_msgs:
-                            logger.info(
-                                "Injecting %d message(s) to %s@%s",
-                                len(new_msgs),
-                                agent_name,
-                                team_name,
-                            )
-                            injected = inject_messages(pane_id, new_msgs)
-                            if injected > 0:
-                                messaging.mark_messages_as_read(team_name, agent_name, injected, base_dir)
-                            if injected < len(new_msgs):
-                                # Partial/no injection — don't advance mtime so we retry next poll
-                                logger.warning(
-                                    "Only %d/%d message(s) injected for %s@%s, will retry",
-                                    injected,
-                                    len(new_msgs),
-                                    agent_name,
-                                    team_name,
-                                )
-                            else:
-                                last_mtime = current_mtime
-                        else:
-                            # No unread messages — advance mtime
-                            last_mtime = current_mtime
+                stamp = _inbox_stamp(inbox)
+                if stamp is not None and stamp != last_stamp:
+                    if await _deliver_unread(team_name, agent_name, pane_id, base_dir):
+                        last_stamp = stamp
+                        failures = 0
+                    else:
+                        # Partial/no injection — keep the old stamp so the retry re-reads
+                        failures += 1
+                        retry = True
             except asyncio.CancelledError:
                 raise
             except Exception:
                 logger.exception("Error in watcher for %s@%s", agent_name, team_name)
+                retry = True
 
-            await asyncio.sleep(_POLL_INTERVAL)
+            if failures >= _MAX_DELIVERY_FAILURES:
+                logger.warning(
+                    "Stopping watcher for %s@%s: pane %s unreachable after %d attempts",
+                    agent_name,
+                    team_name,
+                    pane_id,
+                    failures,
+                )
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), _RETRY_INTERVAL if retry else _RESCAN_INTERVAL)
     except asyncio.CancelledError:
         logger.info("Watcher stopped for %s@%s", agent_name, team_name)
+    finally:
+        if _watchers.get((team_name, agent_name)) is asyncio.current_task():
+            del _watchers[(team_name, agent_name)]
+        _unsubscribe(inbox, wakeup)
+        await _close_sender(pane_id)
 
 
 def start_watcher(
@@ -134,6 +294,17 @@ def stop_all_watchers() -> int:
     return count
 
 
+async def drain_watchers() -> int:
+    """Stop all active watchers and wait for them to release their tmux connections.
+
+    Returns the number of watchers stopped.
+    """
+    tasks = list(_watchers.values())
+    count = stop_all_watchers()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return count
+
+
 def is_watching(team_name: str, agent_name: str) -> bool:
     """Check if a watcher is currently active for an agent."""
     key = (team_name, agent_name)
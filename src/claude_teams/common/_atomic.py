@@ -0,0 +1,53 @@
+"""Atomic file writes shared by the config, task and inbox writers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import stat
+import sys
+import tempfile
+import time
+
+# os.umask can only be read by setting it, so it is sampled once at import.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def replace_with_retry(
+    src: str | os.PathLike, dst: str | os.PathLike, retries: int = 5, base_delay: float = 0.05
+) -> None:
+    for attempt in range(retries):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            # NOTE(victor): On Windows, os.replace raises PermissionError when
+            # antivirus or another process holds the target file handle briefly.
+            # On Unix this indicates a real permissions issue, so we only retry
+            # on Windows.
+            if sys.platform != "win32" or attempt == retries - 1:
+                raise
+            time.sleep(base_delay * (2**attempt))
+
+
+def _target_mode(path: Path) -> int:
+    """Mode for the file replacing `path`: keep the existing one, else what open() would create."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` so readers never see a partially written file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file as 0600; other users' agents must still read it
+        Path(tmp_path).chmod(_target_mode(path))
+        replace_with_retry(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
-import json
 from pathlib import Path
 
+from pydantic import TypeAdapter
+import pydantic_core
+
+from claude_teams.common._atomic import atomic_write_bytes
 from claude_teams.common._filelock import file_lock
 from claude_teams.common._paths import teams_dir
 from claude_teams.common.models import InboxMessage
 
+# Inbox files are parsed by pydantic-core in one pass, skipping the stdlib
+# json round-trip through Python dicts.
+_INBOX_ADAPTER = TypeAdapter(list[InboxMessage])
+
 
 def now_iso() -> str:
-    dt = datetime.now(UTC)
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+    return datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
 def inbox_path(team_name: str, agent_name: str, base_dir: Path | None = None) -> Path:
@@ -41,25 +48,28 @@ def read_inbox(
     if mark_as_read:
         lock_path = path.parent / ".lock"
         with file_lock(lock_path):
-            raw_list = json.loads(path.read_text())
-            all_msgs = [InboxMessage.model_validate(entry) for entry in raw_list]
-
-            result = [m for m in all_msgs if not m.read] if unread_only else list(all_msgs)
-
-            # result elements share references with all_msgs, so mutating
-            # them here updates all_msgs for serialization below.
-            if result:
-                for m in result:
-                    m.read = True
-                serialized = [m.model_dump(by_alias=True, exclude_none=True) for m in all_msgs]
-                path.write_text(json.dumps(serialized))
+            # Flip the read flags on the raw entries and write those back, so
+            # untouched messages (and fields the model doesn't know) are kept
+            # verbatim and only the selected entries get validated.
+            raw_list = pydantic_core.from_json(path.read_bytes())
+            selected = [e for e in raw_list if not e.get("read", False)] if unread_only else raw_list
+            changed = False
+            for entry in selected:
+                if not entry.get("read", False):
+                    entry["read"] = True
+                    changed = True
+            result = _INBOX_ADAPTER.validate_python(selected)
+            if changed:
+                atomic_write_bytes(path, pydantic_core.to_json(raw_list))
 
             return result
     else:
         # Read-only path doesn't need lock
-        raw_list = json.loads(path.read_text())
-        all_msgs = [InboxMessage.model_validate(entry) for entry in raw_list]
-        return [m for m in all_msgs if not m.read] if unread_only else list(all_msgs)
+        if unread_only:
+            # Filter the raw entries first so read history is never validated.
+            raw_list = pydantic_core.from_json(path.read_bytes())
+            return _INBOX_ADAPTER.validate_python([e for e in raw_list if not e.get("read", False)])
+        return _INBOX_ADAPTER.validate_json(path.read_bytes())
 
 
 def mark_messages_as_read(
@@ -78,18 +88,16 @@ def mark_messages_as_read(
         return
     lock_path = path.parent / ".lock"
     with file_lock(lock_path):
-        raw_list = json.loads(path.read_text())
-        all_msgs = [InboxMessage.model_validate(entry) for entry in raw_list]
+        raw_list = pydantic_core.from_json(path.read_bytes())
         marked = 0
-        for m in all_msgs:
+        for entry in raw_list:
             if marked >= count:
                 break
-            if not m.read:
-                m.read = True
+            if not entry.get("read", False):
+                entry["read"] = True
                 marked += 1
         if marked:
-            serialized = [m.model_dump(by_alias=True, exclude_none=True) for m in all_msgs]
-            path.write_text(json.dumps(serialized))
+            atomic_write_bytes(path, pydantic_core.to_json(raw_list))
 
 
 def append_message(
@@ -98,13 +106,26 @@ def append_message(
     message: InboxMessage,
     base_dir: Path | None = None,
 ) -> None:
-    path = ensure_inbox(team_name, agent_name, base_dir)
-    lock_path = path.parent / ".lock"
+    append_messages(team_name, [(agent_name, message)], base_dir)
+
+
+def append_messages(
+    team_name: str,
+    deliveries: Sequence[tuple[str, InboxMessage]],
+    base_dir: Path | None = None,
+) -> None:
+    """Append each (agent_name, message) pair under a single acquisition of the inbox lock."""
+    paths = [ensure_inbox(team_name, agent_name, base_dir) for agent_name, _ in deliveries]
+    if not paths:
+        return
+    lock_path = paths[0].parent / ".lock"
 
     with file_lock(lock_path):
-        raw_list = json.loads(path.read_text())
-        raw_list.append(message.model_dump(by_alias=True, exclude_none=True))
-        path.write_text(json.dumps(raw_list))
+        for path, (_, message) in zip(paths, deliveries, strict=True):
+            # Existing entries stay raw so fields this model doesn't know survive.
+            raw_list = pydantic_core.from_json(path.read_bytes())
+            raw_list.append(message.model_dump(by_alias=True, exclude_none=True))
+            atomic_write_bytes(path, pydantic_core.to_json(raw_list))
 
 
 def send_plain_message(
@@ -116,12 +137,26 @@ def send_plain_message(
     color: str | None = None,
     base_dir: Path | None = None,
 ) -> None:
-    msg = InboxMessage(
-        from_=from_name,
-        text=text,
-        timestamp=now_iso(),
-        read=False,
-        summary=summary,
-        color=color,
+    send_plain_messages(team_name, from_name, [(to_name, text, summary)], color, base_dir)
+
+
+def send_plain_messages(
+    team_name: str,
+    from_name: str,
+    messages: Sequence[tuple[str, str, str]],
+    color: str | None = None,
+    base_dir: Path | None = None,
+) -> None:
+    """Send several (to_name, text, summary) messages with one timestamp and one lock acquisition."""
+    timestamp = now_iso()
+    append_messages(
+        team_name,
+        [
+            (
+                to_name,
+                InboxMessage(from_=from_name, text=text, timestamp=timestamp, read=False, summary=summary, color=color),
+            )
+            for to_name, text, summary in messages
+        ],
+        base_dir,
     )
-    append_message(team_name, to_name, msg, base_dir)
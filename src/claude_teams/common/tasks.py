@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from collections import deque
-import json
 from pathlib import Path
 from typing import Any
 
+import pydantic_core
+
+from claude_teams.common._atomic import atomic_write_bytes
 from claude_teams.common._filelock import file_lock
 from claude_teams.common._paths import tasks_dir
 from claude_teams.common._serialization import model_to_json
@@ -16,10 +18,16 @@ _STATUS_ORDER = {"pending": 0, "in_progress": 1, "completed": 2}
 
 def _flush_pending_writes(pending_writes: dict[Path, TaskFile]) -> None:
     for path, task_obj in pending_writes.items():
-        path.write_text(model_to_json(task_obj))
+        atomic_write_bytes(path, model_to_json(task_obj).encode())
 
 
-def _would_create_cycle(team_dir: Path, from_id: str, to_id: str, pending_edges: dict[str, set[str]]) -> bool:
+def _would_create_cycle(
+    team_dir: Path,
+    from_id: str,
+    to_id: str,
+    pending_edges: dict[str, set[str]],
+    cache: dict[Path, TaskFile],
+) -> bool:
     """True if making from_id blocked_by to_id creates a cycle.
 
     BFS from to_id through blocked_by chains (on-disk + pending);
@@ -35,8 +43,8 @@ def _would_create_cycle(team_dir: Path, from_id: str, to_id: str, pending_edges:
             continue
         visited.add(current)
         fpath = team_dir / f"{current}.json"
-        if fpath.exists():
-            task = TaskFile(**json.loads(fpath.read_text()))
+        if fpath in cache or fpath.exists():
+            task = _load_task(fpath, cache)
             queue.extend(d for d in task.blocked_by if d not in visited)
         queue.extend(d for d in pending_edges.get(current, set()) if d not in visited)
     return False
@@ -77,7 +85,7 @@ def create_task(
             metadata=metadata,
         )
         fpath = team_dir / f"{task_id}.json"
-        fpath.write_text(model_to_json(task))
+        atomic_write_bytes(fpath, model_to_json(task).encode())
 
     return task
 
@@ -85,15 +93,18 @@ def create_task(
 def get_task(team_name: str, task_id: str, base_dir: Path | None = None) -> TaskFile:
     team_dir = tasks_dir(base_dir) / team_name
     fpath = team_dir / f"{task_id}.json"
-    raw = json.loads(fpath.read_text())
-    return TaskFile(**raw)
+    return TaskFile.model_validate_json(fpath.read_bytes())
 
 
-def _read_or_pending(path: Path, pending_writes: dict[Path, TaskFile]) -> TaskFile:
-    """Read a task from pending_writes cache or disk."""
-    if path in pending_writes:
-        return pending_writes[path]
-    return TaskFile(**json.loads(path.read_text()))
+def _load_task(path: Path, cache: dict[Path, TaskFile]) -> TaskFile:
+    """Read a task through the per-update cache, so each file is parsed once.
+
+    Cached tasks may carry in-memory edits that are not yet flushed.
+    """
+    task = cache.get(path)
+    if task is None:
+        task = cache[path] = TaskFile.model_validate_json(path.read_bytes())
+    return task
 
 
 def _iter_valid_task_files(team_dir: Path, exclude_id: str | None = None) -> list[Path]:
@@ -106,24 +117,35 @@ def _iter_valid_task_files(team_dir: Path, exclude_id: str | None = None) -> lis
     Returns:
         List of Path objects for valid task files
     """
+    try:
+        entries = list(team_dir.iterdir())
+    except FileNotFoundError:
+        return []
     result = []
-    for f in team_dir.glob("*.json"):
-        try:
-            int(f.stem)
-        except ValueError:
+    for f in entries:
+        name = f.name
+        if not name.endswith(".json"):
             continue
-        if exclude_id is None or f.stem != exclude_id:
+        stem = name[:-5]
+        if stem.isdecimal() and stem != exclude_id:
             result.append(f)
     return result
 
 
-def _validate_edge_refs(team_dir: Path, task_id: str, ids: list[str], self_error_msg: str) -> None:
-    """Validate that edge target IDs are not self-referencing and exist on disk."""
+def _validate_edge_refs(
+    team_dir: Path, task_id: str, ids: list[str], self_error_msg: str, cache: dict[Path, TaskFile]
+) -> None:
+    """Validate that edge target IDs are not self-referencing and exist on disk.
+
+    Targets are loaded into the cache here, since applying the edges reads them anyway.
+    """
     for b in ids:
         if b == task_id:
             raise ValueError(self_error_msg)
-        if not (team_dir / f"{b}.json").exists():
-            raise ValueError(f"Referenced task {b!r} does not exist")
+        try:
+            _load_task(team_dir / f"{b}.json", cache)
+        except FileNotFoundError:
+            raise ValueError(f"Referenced task {b!r} does not exist") from None
 
 
 def _build_pending_edges(
@@ -131,15 +153,16 @@ def _build_pending_edges(
     task_id: str,
     add_blocks: list[str] | None,
     add_blocked_by: list[str] | None,
+    cache: dict[Path, TaskFile],
 ) -> dict[str, set[str]]:
     """Validate refs exist and build pending edge map for cycle detection."""
     pending_edges: dict[str, set[str]] = {}
     if add_blocks:
-        _validate_edge_refs(team_dir, task_id, add_blocks, f"Task {task_id} cannot block itself")
+        _validate_edge_refs(team_dir, task_id, add_blocks, f"Task {task_id} cannot block itself", cache)
         for b in add_blocks:
             pending_edges.setdefault(b, set()).add(task_id)
     if add_blocked_by:
-        _validate_edge_refs(team_dir, task_id, add_blocked_by, f"Task {task_id} cannot be blocked by itself")
+        _validate_edge_refs(team_dir, task_id, add_blocked_by, f"Task {task_id} cannot be blocked by itself", cache)
         for b in add_blocked_by:
             pending_edges.setdefault(task_id, set()).add(b)
     return pending_edges
@@ -151,15 +174,16 @@ def _check_no_cycles(
     add_blocks: list[str] | None,
     add_blocked_by: list[str] | None,
     pending_edges: dict[str, set[str]],
+    cache: dict[Path, TaskFile],
 ) -> None:
     """Check that proposed edges would not create cycles."""
     if add_blocks:
         for b in add_blocks:
-            if _would_create_cycle(team_dir, b, task_id, pending_edges):
+            if _would_create_cycle(team_dir, b, task_id, pending_edges, cache):
                 raise ValueError(f"Adding block {task_id} -> {b} would create a circular dependency")
     if add_blocked_by:
         for b in add_blocked_by:
-            if _would_create_cycle(team_dir, task_id, b, pending_edges):
+            if _would_create_cycle(team_dir, task_id, b, pending_edges, cache):
                 raise ValueError(f"Adding dependency {task_id} blocked_by {b} would create a circular dependency")
 
 
@@ -168,6 +192,7 @@ def _validate_status_transition(
     task: TaskFile,
     status: str,
     add_blocked_by: list[str] | None,
+    cache: dict[Path, TaskFile],
 ) -> None:
     """Validate that a status transition is allowed."""
     cur_order = _STATUS_ORDER[task.status]
@@ -182,8 +207,8 @@ def _validate_status_transition(
     if status in ("in_progress", "completed") and effective_blocked_by:
         for blocker_id in effective_blocked_by:
             blocker_path = team_dir / f"{blocker_id}.json"
-            if blocker_path.exists():
-                blocker = TaskFile(**json.loads(blocker_path.read_text()))
+            if blocker_path in cache or blocker_path.exists():
+                blocker = _load_task(blocker_path, cache)
                 if blocker.status != "completed":
                     raise ValueError(
                         f"Cannot set status to {status!r}: blocked by task {blocker_id} (status: {blocker.status!r})"
@@ -196,6 +221,7 @@ def _apply_edges(
     task_id: str,
     add_blocks: list[str] | None,
     add_blocked_by: list[str] | None,
+    cache: dict[Path, TaskFile],
     pending_writes: dict[Path, TaskFile],
 ) -> None:
     """Apply add_blocks/add_blocked_by to task and related tasks (in-memory)."""
@@ -206,7 +232,7 @@ def _apply_edges(
                 task.blocks.append(b)
                 existing.add(b)
             b_path = team_dir / f"{b}.json"
-            other = _read_or_pending(b_path, pending_writes)
+            other = _load_task(b_path, cache)
             if task_id not in other.blocked_by:
                 other.blocked_by.append(task_id)
             pending_writes[b_path] = other
@@ -217,7 +243,7 @@ def _apply_edges(
                 task.blocked_by.append(b)
                 existing.add(b)
             b_path = team_dir / f"{b}.json"
-            other = _read_or_pending(b_path, pending_writes)
+            other = _load_task(b_path, cache)
             if task_id not in other.blocks:
                 other.blocks.append(task_id)
             pending_writes[b_path] = other
@@ -234,19 +260,23 @@ def _apply_metadata(task: TaskFile, metadata: dict[str, Any]) -> None:
     task.metadata = current if current else None
 
 
-def _clean_references_on_complete(team_dir: Path, task_id: str, pending_writes: dict[Path, TaskFile]) -> None:
+def _clean_references_on_complete(
+    team_dir: Path, task_id: str, cache: dict[Path, TaskFile], pending_writes: dict[Path, TaskFile]
+) -> None:
     """Remove task_id from blocked_by lists of other tasks when completed."""
     for f in _iter_valid_task_files(team_dir, exclude_id=task_id):
-        other = _read_or_pending(f, pending_writes)
+        other = _load_task(f, cache)
         if task_id in other.blocked_by:
             other.blocked_by.remove(task_id)
             pending_writes[f] = other
 
 
-def _clean_references_on_delete(team_dir: Path, task_id: str, pending_writes: dict[Path, TaskFile]) -> None:
+def _clean_references_on_delete(
+    team_dir: Path, task_id: str, cache: dict[Path, TaskFile], pending_writes: dict[Path, TaskFile]
+) -> None:
     """Remove task_id from both blocked_by and blocks lists of other tasks."""
     for f in _iter_valid_task_files(team_dir, exclude_id=task_id):
-        other = _read_or_pending(f, pending_writes)
+        other = _load_task(f, cache)
         changed = False
         if task_id in other.blocked_by:
             other.blocked_by.remove(task_id)
@@ -281,16 +311,17 @@ def _apply_status_and_cleanup(
     task: TaskFile,
     task_id: str,
     status: str | None,
+    cache: dict[Path, TaskFile],
     pending_writes: dict[Path, TaskFile],
 ) -> None:
     """Apply status change and clean up references in other tasks."""
     if status is not None and status != "deleted":
         task.status = status
         if status == "completed":
-            _clean_references_on_complete(team_dir, task_id, pending_writes)
+            _clean_references_on_complete(team_dir, task_id, cache, pending_writes)
     elif status == "deleted":
         task.status = "deleted"
-        _clean_references_on_delete(team_dir, task_id, pending_writes)
+        _clean_references_on_delete(team_dir, task_id, cache, pending_writes)
 
 
 def _write_task_updates(
@@ -304,7 +335,7 @@ def _write_task_updates(
         _flush_pending_writes(pending_writes)
         fpath.unlink()
     else:
-        fpath.write_text(model_to_json(task))
+        atomic_write_bytes(fpath, model_to_json(task).encode())
         _flush_pending_writes(pending_writes)
 
 
@@ -327,19 +358,22 @@ def update_task(
     fpath = team_dir / f"{task_id}.json"
 
     with file_lock(lock_path):
-        task = TaskFile(**json.loads(fpath.read_text()))
+        # Every task read during this update goes through one cache, so the
+        # cycle checks, blocker checks and edge updates parse each file once.
+        cache: dict[Path, TaskFile] = {}
+        task = _load_task(fpath, cache)
 
-        pending_edges = _build_pending_edges(team_dir, task_id, add_blocks, add_blocked_by)
-        _check_no_cycles(team_dir, task_id, add_blocks, add_blocked_by, pending_edges)
+        pending_edges = _build_pending_edges(team_dir, task_id, add_blocks, add_blocked_by, cache)
+        _check_no_cycles(team_dir, task_id, add_blocks, add_blocked_by, pending_edges, cache)
         if status is not None and status != "deleted":
-            _validate_status_transition(team_dir, task, status, add_blocked_by)
+            _validate_status_transition(team_dir, task, status, add_blocked_by, cache)
 
         pending_writes: dict[Path, TaskFile] = {}
         _apply_scalar_fields(task, subject, description, active_form, owner)
-        _apply_edges(team_dir, task, task_id, add_blocks, add_blocked_by, pending_writes)
+        _apply_edges(team_dir, task, task_id, add_blocks, add_blocked_by, cache, pending_writes)
         if metadata is not None:
             _apply_metadata(task, metadata)
-        _apply_status_and_cleanup(team_dir, task, task_id, status, pending_writes)
+        _apply_status_and_cleanup(team_dir, task, task_id, status, cache, pending_writes)
         _write_task_updates(fpath, task, status, pending_writes)
 
     return task
@@ -351,7 +385,7 @@ def list_tasks(team_name: str, base_dir: Path | None = None) -> list[TaskFile]:
     team_dir = tasks_dir(base_dir) / team_name
     tasks: list[TaskFile] = []
     for f in _iter_valid_task_files(team_dir):
-        tasks.append(TaskFile(**json.loads(f.read_text())))
+        tasks.append(TaskFile.model_validate_json(f.read_bytes()))
     tasks.sort(key=lambda t: int(t.id))
     return tasks
 
@@ -362,9 +396,12 @@ def reset_owner_tasks(team_name: str, agent_name: str, base_dir: Path | None = N
 
     with file_lock(lock_path):
         for f in _iter_valid_task_files(team_dir):
-            task = TaskFile(**json.loads(f.read_text()))
-            if task.owner == agent_name:
-                if task.status != "completed":
-                    task.status = "pending"
-                task.owner = None
-                f.write_text(model_to_json(task))
+            # Peek at the owner before paying for a full validation.
+            raw = pydantic_core.from_json(f.read_bytes())
+            if raw.get("owner") != agent_name:
+                continue
+            task = TaskFile.model_validate(raw)
+            if task.status != "completed":
+                task.status = "pending"
+            task.owner = None
+            atomic_write_bytes(f, model_to_json(task).encode())
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-import json
-import os
+from collections.abc import Callable
 from pathlib import Path
 import re
 import shutil
-import sys
-import tempfile
 import time
 
+from claude_teams.common._atomic import atomic_write_bytes
+from claude_teams.common._filelock import file_lock
 from claude_teams.common._paths import tasks_dir, teams_dir
 from claude_teams.common._serialization import model_to_json
 from claude_teams.common.models import LeadMember, TeamConfig, TeamCreateResult, TeamDeleteResult, TeammateMember
 
 _VALID_NAME_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 
+# Members of recently read configs, indexed by name. Entries are keyed by
+# config path and dropped as soon as the file's (inode, mtime, size) changes.
+_member_index: dict[Path, tuple[tuple[int, int, int], dict[str, LeadMember | TeammateMember]]] = {}
+
+
+def _config_lock_path(name: str, base_dir: Path | None = None) -> Path:
+    return teams_dir(base_dir) / name / ".lock"
+
 
 def team_exists(name: str, base_dir: Path | None = None) -> bool:
     config_path = teams_dir(base_dir) / name / "config.json"
@@ -43,7 +50,7 @@ def create_team(
     task_dir.mkdir(parents=True, exist_ok=True)
     (task_dir / ".lock").touch()
 
-    now_ms = int(time.time() * 1000)
+    now_ms = time.time_ns() // 1_000_000
 
     lead = LeadMember(
         agent_id=f"team-lead@{name}",
@@ -65,7 +72,7 @@ def create_team(
     )
 
     config_path = team_dir / "config.json"
-    config_path.write_text(model_to_json(config, indent=2))
+    atomic_write_bytes(config_path, model_to_json(config, indent=2).encode())
 
     return TeamCreateResult(
         team_name=name,
@@ -77,27 +84,32 @@ def create_team(
 def read_config(name: str, base_dir: Path | None = None) -> TeamConfig:
     config_path = teams_dir(base_dir) / name / "config.json"
     try:
-        raw = json.loads(config_path.read_text())
+        data = config_path.read_bytes()
     except FileNotFoundError:
         raise FileNotFoundError(f"Team {name!r} not found")
-    return TeamConfig.model_validate(raw)
-
-
-def _replace_with_retry(
-    src: str | os.PathLike, dst: str | os.PathLike, retries: int = 5, base_delay: float = 0.05
-) -> None:
-    for attempt in range(retries):
-        try:
-            os.replace(src, dst)
-            return
-        except PermissionError:
-            # NOTE(victor): On Windows, os.replace raises PermissionError when
-            # antivirus or another process holds the target file handle briefly.
-            # On Unix this indicates a real permissions issue, so we only retry
-            # on Windows.
-            if sys.platform != "win32" or attempt == retries - 1:
-                raise
-            time.sleep(base_delay * (2**attempt))
+    return TeamConfig.model_validate_json(data)
+
+
+def get_member(team_name: str, agent_name: str, base_dir: Path | None = None) -> LeadMember | TeammateMember | None:
+    """Look up one member by name, re-parsing config.json only when it has changed.
+
+    The returned model is shared with the cache and must not be mutated.
+    Returns None if the team has no such member; raises FileNotFoundError
+    if the team does not exist.
+    """
+    config_path = teams_dir(base_dir) / team_name / "config.json"
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        _member_index.pop(config_path, None)
+        raise FileNotFoundError(f"Team {team_name!r} not found") from None
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _member_index.get(config_path)
+    if cached is None or cached[0] != stamp:
+        config = read_config(team_name, base_dir)
+        cached = (stamp, {m.name: m for m in config.members})
+        _member_index[config_path] = cached
+    return cached[1].get(agent_name)
 
 
 def write_config(name: str, config: TeamConfig, base_dir: Path | None = None) -> None:
@@ -105,18 +117,24 @@ def write_config(name: str, config: TeamConfig, base_dir: Path | None = None) ->
     data = model_to_json(config, indent=2)
 
     # NOTE(victor): atomic write to avoid partial reads from concurrent agents
-    fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix=".tmp")
-    try:
-        os.write(fd, data.encode())
-        os.close(fd)
-        fd = -1
-        _replace_with_retry(tmp_path, config_dir / "config.json")
-    except BaseException:
-        if fd >= 0:
-            os.close(fd)
-        if Path(tmp_path).exists():
-            Path(tmp_path).unlink()
-        raise
+    atomic_write_bytes(config_dir / "config.json", data.encode())
+
+
+def transact[T](team_name: str, fn: Callable[[TeamConfig], T], base_dir: Path | None = None) -> T:
+    """Read, modify and write the team config as one step under the team lock.
+
+    `fn` mutates the config in place and its return value is passed back.
+    Nothing is written if `fn` raises. Raises FileNotFoundError if the team
+    does not exist.
+    """
+    # Checked before locking: the lock file would otherwise create the team dir.
+    if not team_exists(team_name, base_dir):
+        raise FileNotFoundError(f"Team {team_name!r} not found")
+    with file_lock(_config_lock_path(team_name, base_dir)):
+        config = read_config(team_name, base_dir=base_dir)
+        result = fn(config)
+        write_config(team_name, config, base_dir=base_dir)
+        return result
 
 
 def delete_team(name: str, base_dir: Path | None = None) -> TeamDeleteResult:
@@ -139,18 +157,42 @@ def delete_team(name: str, base_dir: Path | None = None) -> TeamDeleteResult:
     )
 
 
-def add_member(name: str, member: TeammateMember, base_dir: Path | None = None) -> None:
-    config = read_config(name, base_dir=base_dir)
-    existing_names = {m.name for m in config.members}
-    if member.name in existing_names:
-        raise ValueError(f"Member {member.name!r} already exists in team {name!r}")
+def append_member(config: TeamConfig, member: TeammateMember) -> None:
+    """Add `member` to an in-memory config, e.g. inside a `transact` callback.
+
+    Raises ValueError if the team already has a member with that name.
+    """
+    if any(m.name == member.name for m in config.members):
+        raise ValueError(f"Member {member.name!r} already exists in team {config.name!r}")
     config.members.append(member)
-    write_config(name, config, base_dir=base_dir)
+
+
+def add_member(name: str, member: TeammateMember, base_dir: Path | None = None) -> None:
+    transact(name, lambda config: append_member(config, member), base_dir)
 
 
 def remove_member(team_name: str, agent_name: str, base_dir: Path | None = None) -> None:
     if agent_name == "team-lead":
         raise ValueError("Cannot remove team-lead from team")
-    config = read_config(team_name, base_dir=base_dir)
-    config.members = [m for m in config.members if m.name != agent_name]
-    write_config(team_name, config, base_dir=base_dir)
+
+    def remove(config: TeamConfig) -> None:
+        config.members = [m for m in config.members if m.name != agent_name]
+
+    transact(team_name, remove, base_dir)
+
+
+def update_member(team_name: str, agent_name: str, base_dir: Path | None = None, **fields: object) -> None:
+    """Set `fields` (model attribute names, e.g. tmux_pane_id) on one teammate in a single locked write.
+
+    Raises ValueError if the team has no such teammate.
+    """
+
+    def update(config: TeamConfig) -> None:
+        for m in config.members:
+            if isinstance(m, TeammateMember) and m.name == agent_name:
+                for field, value in fields.items():
+                    setattr(m, field, value)
+                return
+        raise ValueError(f"Member {agent_name!r} not found in team {team_name!r}")
+
+    transact(team_name, update, base_dir)
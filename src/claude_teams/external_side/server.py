@@ -68,33 +68,23 @@ def send_message(
     if sender == recipient:
         raise ToolError("Cannot send a message to yourself")
 
+    # get_member re-parses config.json only when the file has changed
     try:
-        config = teams.read_config(team_name)
+        sender_member = teams.get_member(team_name, sender)
+        recipient_member = teams.get_member(team_name, recipient)
     except FileNotFoundError:
         raise ToolError(f"Team {team_name!r} not found")
 
-    member_names = {m.name for m in config.members}
-    if sender not in member_names:
+    if sender_member is None:
         raise ToolError(f"Sender {sender!r} is not a member of team {team_name!r}")
-    if recipient not in member_names:
+    if recipient_member is None:
         raise ToolError(f"Recipient {recipient!r} is not a member of team {team_name!r}")
 
-    messaging.send_plain_message(
-        team_name,
-        sender,
-        recipient,
-        content,
-        summary=summary,
-    )
+    deliveries = [(recipient, content, summary)]
     # CC team-lead when non-lead agents message each other directly
     if cc_team_lead and sender != "team-lead" and recipient != "team-lead":
-        messaging.send_plain_message(
-            team_name,
-            sender,
-            "team-lead",
-            content,
-            summary=f"[CC {sender}->{recipient}] {summary}",
-        )
+        deliveries.append(("team-lead", content, f"[CC {sender}->{recipient}] {summary}"))
+    messaging.send_plain_messages(team_name, sender, deliveries)
     return SendMessageResult(
         success=True,
         message=f"Message sent to {recipient}",
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
+import threading
 import time
 
 from fastmcp import Client
@@ -51,7 +53,7 @@ async def client(tmp_path: Path, monkeypatch):
     )
     monkeypatch.setattr(
         "claude_teams.claude_side.spawner.subprocess.run",
-        lambda *a, **kw: type("R", (), {"stdout": "%99\n", "returncode": 0})(),
+        lambda *a, **kw: type("R", (), {"stdout": b"%99\n", "returncode": 0})(),
     )
     (tmp_path / "teams").mkdir()
     (tmp_path / "tasks").mkdir()
@@ -86,6 +88,31 @@ class TestSpawnExternalAgent:
         assert data["name"] == "codex-worker"
         assert data["agent_id"] == "codex-worker@t1"
 
+    async def test_should_spawn_concurrently_off_event_loop(self, client: Client, monkeypatch):
+        threads = set()
+
+        def fake_run(*a, **kw):
+            threads.add(threading.current_thread())
+            return type("R", (), {"stdout": b"%99\n", "returncode": 0})()
+
+        monkeypatch.setattr("claude_teams.claude_side.spawner.subprocess.run", fake_run)
+        monkeypatch.setattr("claude_teams.claude_side.server.watcher.start_watcher", lambda *a: None)
+        _setup_team("tpar")
+        results = await asyncio.gather(
+            *(
+                client.call_tool(
+                    "spawn_external_agent",
+                    {"team_name": "tpar", "name": f"w{i}", "prompt": "do stuff", "cwd": "/tmp"},
+                )
+                for i in range(3)
+            )
+        )
+        assert all(r.is_error is False for r in results)
+        assert threading.main_thread() not in threads
+        members = teams.read_config("tpar").members
+        assert {m.name for m in members} == {"team-lead", "w0", "w1", "w2"}
+        assert len({m.color for m in members if isinstance(m, TeammateMember)}) == 3
+
     async def test_should_reject_missing_cwd(self, client: Client):
         _setup_team("t2")
         result = await client.call_tool(
@@ -116,6 +143,22 @@ class TestSpawnExternalAgent:
         assert result.is_error is True
         assert "cwd" in result.content[0].text.lower()
 
+    async def test_should_reject_missing_cwd_directory_before_registering(self, client: Client, tmp_path: Path):
+        _setup_team("t3b")
+        result = await client.call_tool(
+            "spawn_external_agent",
+            {
+                "team_name": "t3b",
+                "name": "worker",
+                "prompt": "do stuff",
+                "cwd": str(tmp_path / "missing"),
+            },
+            raise_on_error=False,
+        )
+        assert result.is_error is True
+        assert "cwd" in result.content[0].text.lower()
+        assert [m.name for m in teams.read_config("t3b").members] == ["team-lead"]
+
 
 class TestCheckExternalAgent:
     async def test_should_return_error_for_unknown_agent(self, client: Client):
@@ -178,3 +221,46 @@ class TestShutdownExternalAgent:
         )
         assert result.is_error is False
         assert killed == ["%77"]
+
+
+class TestShutdownAllExternalAgents:
+    async def test_should_stop_all_external_agents(self, client: Client, monkeypatch):
+        killed = []
+        monkeypatch.setattr(
+            "claude_teams.claude_side.server.kill_tmux_panes",
+            lambda pane_ids: killed.append(pane_ids),
+        )
+        _setup_team("tsall")
+        teams.add_member("tsall", _make_teammate("w1", "tsall", pane_id="%1"))
+        teams.add_member("tsall", _make_teammate("w2", "tsall", pane_id="@2"))
+        teams.add_member("tsall", _make_teammate("native", "tsall", pane_id="%3"))
+        _external_agents.update({("tsall", "w1"), ("tsall", "w2")})
+        result = await client.call_tool("shutdown_all_external_agents", {"team_name": "tsall"})
+        data = json.loads(result.content[0].text)
+        assert sorted(data["stopped"]) == ["w1", "w2"]
+        assert killed == [["%1", "@2"]]
+        names = [m.name for m in teams.read_config("tsall").members]
+        assert names == ["team-lead", "native"]
+
+    async def test_should_stop_watchers_on_the_event_loop(self, client: Client, monkeypatch):
+        monkeypatch.setattr("claude_teams.claude_side.server.kill_tmux_panes", lambda pane_ids: None)
+        loops = []
+        # get_running_loop raises in a worker thread, where cancelling watcher tasks is unsafe.
+        monkeypatch.setattr(
+            "claude_teams.claude_side.server.watcher.stop_watcher",
+            lambda team_name, agent_name: loops.append(asyncio.get_running_loop()),
+        )
+        _setup_team("tsloop")
+        teams.add_member("tsloop", _make_teammate("w1", "tsloop", pane_id="%1"))
+        _external_agents.add(("tsloop", "w1"))
+        result = await client.call_tool("shutdown_all_external_agents", {"team_name": "tsloop"})
+        assert result.is_error is False
+        assert loops == [asyncio.get_running_loop()]
+
+    async def test_should_reject_unknown_team(self, client: Client):
+        result = await client.call_tool(
+            "shutdown_all_external_agents",
+            {"team_name": "no-such-team"},
+            raise_on_error=False,
+        )
+        assert result.is_error is True
@@ -74,6 +74,32 @@ class TestSendMessage:
         assert inbox[0].from_ == "worker"
         assert "done with task" in inbox[0].text
 
+    async def test_should_not_reparse_unchanged_config(self, client: Client, monkeypatch):
+        _setup_team("t-cache")
+        teams.add_member("t-cache", _make_teammate("worker", "t-cache"))
+        parses = 0
+        real_read_config = teams.read_config
+
+        def counting_read_config(*args, **kwargs):
+            nonlocal parses
+            parses += 1
+            return real_read_config(*args, **kwargs)
+
+        monkeypatch.setattr(teams, "read_config", counting_read_config)
+        for i in range(3):
+            result = await client.call_tool(
+                "send_message",
+                {
+                    "team_name": "t-cache",
+                    "sender": "worker",
+                    "recipient": "team-lead",
+                    "content": f"update {i}",
+                    "summary": "status",
+                },
+            )
+            assert _data(result)["success"] is True
+        assert parses <= 1
+
     async def test_should_cc_team_lead_on_peer_messages(self, client: Client):
         _setup_team("t2")
         teams.add_member("t2", _make_teammate("alice", "t2"))
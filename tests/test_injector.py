@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import subprocess
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from claude_teams.claude_side import injector
 from claude_teams.claude_side.injector import (
     _TMUX_SEND_KEYS_MAX,
+    PersistentTmuxSender,
+    _quote_arg,
+    _run_tmux,
+    build_inject_args,
     format_message_for_injection,
     inject_message,
     inject_messages,
 )
+from claude_teams.claude_side.tmux_introspection import TMUX_BINARY
 from claude_teams.common.models import InboxMessage
 
 
@@ -27,74 +37,258 @@ class TestFormatMessage:
         assert "line1\nline2" in result
 
 
-class TestInjectMessage:
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_calls_tmux_send_keys(self, mock_run: MagicMock) -> None:
-        result = inject_message("%42", _msg(text="hello"))
-        assert result is True
-        assert mock_run.call_count == 2
-        # First call: send text literally
-        text_args = mock_run.call_args_list[0][0][0]
-        assert text_args[:4] == ["tmux", "send-keys", "-t", "%42"]
-        assert "-l" in text_args
-        assert "hello" in text_args[-1]
-        # Second call: send Enter key
-        enter_args = mock_run.call_args_list[1][0][0]
-        assert enter_args == ["tmux", "send-keys", "-t", "%42", "Enter"]
-
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_long_text_sent_in_chunks(self, mock_run: MagicMock) -> None:
+class TestBuildInjectArgs:
+    def test_single_chunk_is_one_invocation(self) -> None:
+        args = build_inject_args("%42", "hello")
+        assert args[0] == TMUX_BINARY
+        assert args.count("send-keys") == 2
+        text_idx = args.index("-l")
+        assert args[text_idx + 1 : text_idx + 3] == ["--", "hello"]
+        assert args[-4:] == ["send-keys", "-t", "%42", "Enter"]
+        # No inter-chunk pause, only the render delay before Enter
+        assert args.count("run-shell") == 1
+
+    def test_long_text_is_paced_between_chunks(self) -> None:
         long_text = "A" * (_TMUX_SEND_KEYS_MAX * 3 + 100)
-        result = inject_message("%42", _msg(text=long_text))
+        args = build_inject_args("%42", long_text)
+        chunks = [args[i + 2] for i, a in enumerate(args) if a == "-l"]
+        assert len(chunks) == 4
+        assert all(len(c) <= _TMUX_SEND_KEYS_MAX for c in chunks)
+        assert "".join(chunks) == long_text
+        # 3 inter-chunk pauses + 1 render delay
+        assert args.count("run-shell") == 4
+
+    def test_multibyte_chunks_fit_byte_limit(self) -> None:
+        text = "a" + "日本語🙂" * 400
+        args = build_inject_args("%42", text)
+        chunks = [args[i + 2] for i, a in enumerate(args) if a == "-l"]
+        assert len(chunks) > 1
+        assert all(len(c.encode()) <= _TMUX_SEND_KEYS_MAX for c in chunks)
+        assert "".join(chunks) == text
+
+    def test_escapes_trailing_semicolon(self) -> None:
+        args = build_inject_args("%42", "stop;")
+        assert args[args.index("-l") + 2] == "stop\\;"
+
+
+class TestRunTmux:
+    async def test_raises_on_nonzero_exit(self) -> None:
+        proc = MagicMock(returncode=1)
+        proc.communicate = AsyncMock(return_value=(None, b"no server running"))
+        with (
+            patch("claude_teams.claude_side.injector.asyncio.create_subprocess_exec", return_value=proc),
+            pytest.raises(subprocess.CalledProcessError) as exc_info,
+        ):
+            await _run_tmux(["tmux", "send-keys"])
+        assert exc_info.value.stderr == b"no server running"
+
+
+class TestInjectMessage:
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_calls_tmux_once(self, mock_run: AsyncMock) -> None:
+        result = await inject_message("%42", _msg(text="hello"))
         assert result is True
-        # 4 chunk calls + 1 Enter call = 5
-        assert mock_run.call_count == 5
-        # Verify each chunk is <= _TMUX_SEND_KEYS_MAX
-        for call in mock_run.call_args_list[:-1]:
-            chunk_text = call[0][0][-1]  # last arg is the text chunk
-            assert len(chunk_text) <= _TMUX_SEND_KEYS_MAX
-        # Last call is Enter
-        assert mock_run.call_args_list[-1][0][0][-1] == "Enter"
-
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_returns_false_on_failure(self, mock_run: MagicMock) -> None:
-        import subprocess
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, ["tmux"], stderr="error")
-        result = inject_message("%42", _msg())
+        assert mock_run.await_count == 1
+        args = mock_run.call_args[0][0]
+        assert args[:4] == [TMUX_BINARY, "send-keys", "-t", "%42"]
+        assert "[Message from team-lead]: hello" in args
+        assert args[-1] == "Enter"
+
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_returns_false_on_failure(self, mock_run: AsyncMock) -> None:
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["tmux"], stderr=b"error")
+        result = await inject_message("%42", _msg())
         assert result is False
 
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_returns_false_when_tmux_not_found(self, mock_run: MagicMock) -> None:
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_returns_false_when_tmux_not_found(self, mock_run: AsyncMock) -> None:
         mock_run.side_effect = FileNotFoundError("tmux")
-        result = inject_message("%42", _msg())
+        result = await inject_message("%42", _msg())
         assert result is False
 
 
 class TestInjectMessages:
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_injects_all_messages(self, mock_run: MagicMock) -> None:
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_batches_messages_into_one_turn(self, mock_run: AsyncMock) -> None:
         msgs = [_msg(text=f"msg-{i}") for i in range(3)]
-        count = inject_messages("%42", msgs)
+        count = await inject_messages("%42", msgs)
         assert count == 3
-        assert mock_run.call_count == 6  # 2 calls per message (text + Enter)
-
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_stops_on_failure(self, mock_run: MagicMock) -> None:
-        import subprocess
-
-        # msg1: text ok, enter ok; msg2: text fails; msg3: skipped
-        mock_run.side_effect = [
-            None,
-            None,  # msg1 text + enter
-            subprocess.CalledProcessError(1, ["tmux"], stderr="err"),  # msg2 text fails
-        ]
-        msgs = [_msg(text=f"msg-{i}") for i in range(3)]
-        count = inject_messages("%42", msgs)
-        assert count == 1  # first succeeded, second failed, third skipped
+        assert mock_run.await_count == 1
+        args = mock_run.call_args[0][0]
+        expected = "\n\n".join(f"[Message from team-lead]: msg-{i}" for i in range(3))
+        assert expected in args
+        assert args.count("Enter") == 1
 
-    @patch("claude_teams.claude_side.injector.subprocess.run")
-    def test_empty_list(self, mock_run: MagicMock) -> None:
-        count = inject_messages("%42", [])
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_batch_failure_injects_nothing(self, mock_run: AsyncMock) -> None:
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["tmux"], stderr=b"err")
+        count = await inject_messages("%42", [_msg(text="a"), _msg(text="b")])
+        assert count == 0
+
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_empty_list(self, mock_run: AsyncMock) -> None:
+        count = await inject_messages("%42", [])
         assert count == 0
         mock_run.assert_not_called()
+
+
+class _FakeStreamWriter:
+    def __init__(self, on_close) -> None:
+        self.written = bytearray()
+        self._closing = False
+        self._on_close = on_close
+
+    def write(self, data: bytes) -> None:
+        self.written += data
+
+    async def drain(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        self._closing = True
+        self._on_close()
+
+
+class _FakeControlClient:
+    """Stands in for a `tmux -C` process: records stdin, replays canned stdout.
+
+    Like tmux, it exits once its stdin is closed unless `hangs` is set.
+    """
+
+    def __init__(self, replies: list[str]) -> None:
+        self.stdin = _FakeStreamWriter(self._on_stdin_closed)
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data("".join(replies).encode())
+        self.stdout.feed_eof()
+        self.returncode: int | None = None
+        self.killed = False
+        self.hangs = False
+        self._exited = asyncio.Event()
+
+    def _on_stdin_closed(self) -> None:
+        if not self.hangs:
+            self._exit(0)
+
+    def _exit(self, code: int) -> None:
+        self.returncode = code
+        self._exited.set()
+
+    def kill(self) -> None:
+        self.killed = True
+        self._exit(-9)
+
+    async def wait(self) -> int:
+        await self._exited.wait()
+        return self.returncode
+
+
+_HANDSHAKE = ["%begin 1 1 0\n", "%end 1 1 0\n", "%session-changed $0 main\n"]
+
+
+async def _sender_with(replies: list[str]) -> tuple[PersistentTmuxSender, _FakeControlClient]:
+    lookup = MagicMock()
+    lookup.communicate = AsyncMock(return_value=(b"$0\n", None))
+    fake = _FakeControlClient(_HANDSHAKE + replies)
+    with patch(
+        "claude_teams.claude_side.injector.asyncio.create_subprocess_exec",
+        side_effect=[lookup, fake],
+    ):
+        sender = await PersistentTmuxSender.open("%42")
+    return sender, fake
+
+
+class TestQuoteArg:
+    def test_escapes_tmux_specials(self) -> None:
+        assert _quote_arg('say "hi" $HOME\\') == '"say \\"hi\\" \\$HOME\\\\"'
+
+    def test_escapes_control_characters(self) -> None:
+        assert _quote_arg("a\nb\tc") == '"a\\nb\\011c"'
+
+
+def _block(n: int, *output: str) -> list[str]:
+    return [f"%begin 2 {n} 1\n", *output, f"%end 2 {n} 1\n"]
+
+
+class TestPersistentTmuxSender:
+    async def test_send_types_then_presses_enter_once_rendered(self) -> None:
+        replies = _block(1) + _block(2, "> [Message from team-lead]: hello\n") + _block(3)
+        sender, fake = await _sender_with(replies)
+        await sender.send("[Message from team-lead]: hello")
+        lines = fake.stdin.written.decode().splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith('"send-keys" "-t" "%42" "-l" "--" "[Message')
+        assert lines[1].startswith('"capture-pane"')
+        assert lines[2] == '"send-keys" "-t" "%42" "Enter"'
+
+    async def test_send_presses_enter_after_bounded_wait(self, monkeypatch) -> None:
+        monkeypatch.setattr(injector, "_RENDER_POLL_INTERVAL", 0)
+        captures = [line for n in range(injector._RENDER_POLL_ATTEMPTS) for line in _block(10 + n, "busy\n")]
+        sender, fake = await _sender_with(_block(1) + captures + _block(99))
+        await sender.send("hello")
+        lines = fake.stdin.written.decode().splitlines()
+        assert len(lines) == injector._RENDER_POLL_ATTEMPTS + 2
+        assert lines[-1] == '"send-keys" "-t" "%42" "Enter"'
+
+    async def test_output_line_resembling_end_does_not_close_block(self) -> None:
+        sender, _ = await _sender_with(_block(5, "%end 0 0 0\n", "tail\n"))
+        assert await sender._run([["capture-pane", "-p"]]) == "%end 0 0 0\ntail\n"
+
+    async def test_send_raises_on_tmux_error(self) -> None:
+        sender, _ = await _sender_with(["%begin 2 2 1\n", "can't find pane: %42\n", "%error 2 2 1\n"])
+        with pytest.raises(RuntimeError, match="can't find pane"):
+            await sender.send("hello")
+
+    async def test_send_raises_when_client_exits(self) -> None:
+        sender, _ = await _sender_with(["%exit\n"])
+        with pytest.raises(BrokenPipeError):
+            await sender.send("hello")
+        assert sender.closed
+
+    async def test_open_gives_up_on_unresponsive_tmux(self, monkeypatch) -> None:
+        monkeypatch.setattr(injector, "_OPEN_TIMEOUT", 0.05)
+        lookup = MagicMock()
+        lookup.communicate = AsyncMock(return_value=(b"$0\n", None))
+        fake = _FakeControlClient([])
+        fake.stdout = asyncio.StreamReader()  # never answers the handshake
+        fake.hangs = True
+        with (
+            patch("claude_teams.claude_side.injector.asyncio.create_subprocess_exec", side_effect=[lookup, fake]),
+            pytest.raises(TimeoutError),
+        ):
+            await PersistentTmuxSender.open("%42")
+        assert fake.stdin.is_closing()
+        assert fake.killed
+
+    async def test_aclose_reaps_client(self) -> None:
+        sender, fake = await _sender_with([])
+        await sender.aclose()
+        assert fake.returncode == 0
+        assert not fake.killed
+
+    async def test_aclose_kills_client_that_does_not_exit(self, monkeypatch) -> None:
+        monkeypatch.setattr(injector, "_CLOSE_TIMEOUT", 0.05)
+        sender, fake = await _sender_with([])
+        fake.hangs = True
+        await sender.aclose()
+        assert fake.killed
+        assert sender.closed
+
+    async def test_refuses_unknown_pane(self) -> None:
+        lookup = MagicMock()
+        lookup.communicate = AsyncMock(return_value=(b"", None))
+        with (
+            patch("claude_teams.claude_side.injector.asyncio.create_subprocess_exec", return_value=lookup),
+            pytest.raises(OSError, match="no tmux session"),
+        ):
+            await PersistentTmuxSender.open("%404")
+
+    @patch("claude_teams.claude_side.injector._run_tmux")
+    async def test_inject_falls_back_when_connection_lost(self, mock_run: AsyncMock) -> None:
+        sender = MagicMock(closed=False)
+        sender.send = AsyncMock(side_effect=BrokenPipeError())
+        assert await inject_message("%42", _msg(), sender) is True
+        sender.send.assert_awaited_once()
+        mock_run.assert_awaited_once()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 import threading
 
@@ -14,6 +15,7 @@ from claude_teams.common.messaging import (
     now_iso,
     read_inbox,
     send_plain_message,
+    send_plain_messages,
 )
 from claude_teams.common.models import InboxMessage
 
@@ -60,6 +62,35 @@ def test_append_message_does_not_overwrite(tmp_claude_dir):
     assert "second" in texts
 
 
+def test_append_message_keeps_unknown_fields(tmp_claude_dir):
+    path = ensure_inbox("test-team", "bob", base_dir=tmp_claude_dir)
+    path.write_text(json.dumps([{"from": "lead", "text": "old", "timestamp": now_iso(), "read": True, "extra": 1}]))
+    msg = InboxMessage(from_="lead", text="new", timestamp=now_iso(), read=False)
+    append_message("test-team", "bob", msg, base_dir=tmp_claude_dir)
+    raw = json.loads(path.read_bytes())
+    assert raw[0]["extra"] == 1
+    assert raw[1]["text"] == "new"
+
+
+def test_marking_read_keeps_unknown_fields(tmp_claude_dir):
+    path = ensure_inbox("test-team", "bob", base_dir=tmp_claude_dir)
+    entries = [{"from": "lead", "text": t, "timestamp": now_iso(), "read": False, "extra": t} for t in ("a", "b")]
+    path.write_text(json.dumps(entries))
+    read_inbox("test-team", "bob", unread_only=True, base_dir=tmp_claude_dir)
+    mark_messages_as_read("test-team", "bob", 1, base_dir=tmp_claude_dir)
+    raw = json.loads(path.read_bytes())
+    assert [e["extra"] for e in raw] == ["a", "b"]
+    assert all(e["read"] for e in raw)
+
+
+def test_non_ascii_text_round_trips(tmp_claude_dir):
+    send_plain_message("test-team", "lead", "bob", "héllo → 世界", summary="s", base_dir=tmp_claude_dir)
+    read_inbox("test-team", "bob", base_dir=tmp_claude_dir)
+    msgs = read_inbox("test-team", "bob", mark_as_read=False, base_dir=tmp_claude_dir)
+    assert msgs[0].text == "héllo → 世界"
+    assert msgs[0].read is True
+
+
 def test_read_inbox_returns_all_by_default(tmp_claude_dir):
     msg1 = InboxMessage(from_="lead", text="a", timestamp=now_iso(), read=False, summary="s1")
     msg2 = InboxMessage(from_="lead", text="b", timestamp=now_iso(), read=True, summary="s2")
@@ -167,3 +198,41 @@ class TestMarkMessagesAsRead:
 
     def test_nonexistent_inbox_is_noop(self, tmp_claude_dir) -> None:
         mark_messages_as_read("test-team", "ghost", 5, base_dir=tmp_claude_dir)
+
+
+def test_read_inbox_skips_rewrite_when_all_already_read(tmp_claude_dir):
+    send_plain_message("test-team", "lead", "bob", "hi", summary="s", base_dir=tmp_claude_dir)
+    read_inbox("test-team", "bob", base_dir=tmp_claude_dir)
+    path = inbox_path("test-team", "bob", base_dir=tmp_claude_dir)
+    before = path.stat().st_mtime_ns
+    os.utime(path, ns=(before - 10**9, before - 10**9))
+
+    msgs = read_inbox("test-team", "bob", base_dir=tmp_claude_dir)
+
+    assert len(msgs) == 1
+    assert path.stat().st_mtime_ns == before - 10**9
+
+
+def test_send_plain_messages_shares_timestamp_and_lock(tmp_claude_dir, monkeypatch):
+    from claude_teams.common import messaging
+
+    acquired: list[Path] = []
+    real_file_lock = messaging.file_lock
+
+    def counting_file_lock(lock_path):
+        acquired.append(lock_path)
+        return real_file_lock(lock_path)
+
+    monkeypatch.setattr(messaging, "file_lock", counting_file_lock)
+    send_plain_messages(
+        "test-team",
+        "alice",
+        [("bob", "hi", "s"), ("team-lead", "hi", "[CC alice->bob] s")],
+        base_dir=tmp_claude_dir,
+    )
+
+    assert len(acquired) == 1
+    bob = read_inbox("test-team", "bob", mark_as_read=False, base_dir=tmp_claude_dir)
+    lead = read_inbox("test-team", "team-lead", mark_as_read=False, base_dir=tmp_claude_dir)
+    assert bob[0].timestamp == lead[0].timestamp
+    assert lead[0].summary == "[CC alice->bob] s"
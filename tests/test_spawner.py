@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from claude_teams.claude_side import spawner
 from claude_teams.claude_side.registry import _external_agents, _next_color
 from claude_teams.claude_side.spawner import (
     _has_tmux_session,
@@ -12,8 +14,11 @@ from claude_teams.claude_side.spawner import (
     build_tmux_spawn_args,
     discover_backend_binaries,
     kill_tmux_pane,
+    kill_tmux_panes,
     spawn_external,
+    wrap_prompt,
 )
+from claude_teams.claude_side.tmux_introspection import TMUX_BINARY
 from claude_teams.common import messaging, teams
 from claude_teams.common.models import COLOR_PALETTE, TeammateMember
 
@@ -56,7 +61,7 @@ def _make_member(
 
 class TestNextColor:
     def test_first_teammate_is_blue(self, team_dir: Path) -> None:
-        color = _next_color(TEAM, base_dir=team_dir)
+        color = _next_color(teams.read_config(TEAM, base_dir=team_dir))
         assert color == "blue"
 
     def test_cycles(self, team_dir: Path) -> None:
@@ -64,32 +69,61 @@ class TestNextColor:
             member = _make_member(f"agent-{i}", color=COLOR_PALETTE[i])
             teams.add_member(TEAM, member, base_dir=team_dir)
 
-        color = _next_color(TEAM, base_dir=team_dir)
+        color = _next_color(teams.read_config(TEAM, base_dir=team_dir))
         assert color == COLOR_PALETTE[0]
 
+    def test_counts_unsaved_members(self, team_dir: Path) -> None:
+        config = teams.read_config(TEAM, base_dir=team_dir)
+        config.members.append(_make_member("agent-0"))
+        assert _next_color(config) == COLOR_PALETTE[1]
+
+
+class TestWrapPrompt:
+    def test_lists_other_members_only(self, team_dir: Path) -> None:
+        teams.add_member(TEAM, _make_member("coder", agent_type="code-writer"), base_dir=team_dir)
+        members = teams.read_config(TEAM, base_dir=team_dir).members
+        wrapped = wrap_prompt("codex", "coder", TEAM, "Do work", members=members)
+        assert "- team-lead (team-lead)" in wrapped
+        assert "- coder (" not in wrapped
+
+    def test_no_teammates(self) -> None:
+        wrapped = wrap_prompt("codex", "solo", TEAM, "Do work")
+        assert "(no other teammates yet)" in wrapped
+
+    def test_matches_template_format(self) -> None:
+        wrapped = wrap_prompt("codex", "coder", TEAM, "Use {braces} as-is", agent_type="code-writer")
+        assert wrapped == spawner._CODEX_PROMPT_TEMPLATE.format(
+            name="coder",
+            team_name=TEAM,
+            agent_type="code-writer",
+            teammates_section="(no other teammates yet)",
+            prompt="Use {braces} as-is",
+        )
+
 
 class TestBuildSpawnCommand:
     def test_codex_format(self) -> None:
-        cmd = build_spawn_command("codex", "/usr/local/bin/codex", "Do research", "/tmp/work")
-        assert "/usr/local/bin/codex" in cmd
-        assert "--dangerously-bypass-approvals-and-sandbox" in cmd
-        assert "--no-alt-screen" in cmd
-        assert "cd /tmp/work" in cmd
+        cmd = build_spawn_command("codex", "/usr/local/bin/codex", "Do research")
+        assert cmd == [
+            "/usr/local/bin/codex",
+            "--dangerously-bypass-approvals-and-sandbox",
+            "--no-alt-screen",
+            "Do research",
+        ]
 
     def test_codex_should_not_contain_claude_flags(self) -> None:
-        cmd = build_spawn_command("codex", "/usr/local/bin/codex", "Do research", "/tmp")
+        cmd = build_spawn_command("codex", "/usr/local/bin/codex", "Do research")
         assert "CLAUDECODE" not in cmd
         assert "--agent-id" not in cmd
         assert "--team-name" not in cmd
 
     def test_gemini_format(self) -> None:
-        cmd = build_spawn_command("gemini", "/usr/bin/gemini", "Do research", "/tmp/work")
-        assert "/usr/bin/gemini" in cmd
-        assert "-m " not in cmd  # no hardcoded model, use Gemini CLI default
+        cmd = build_spawn_command("gemini", "/usr/bin/gemini", "Do research")
+        assert cmd[0] == "/usr/bin/gemini"
+        assert "-m" not in cmd  # no hardcoded model, use Gemini CLI default
         assert "--yolo" in cmd
         assert "--screen-reader" in cmd
-        assert "--prompt-interactive" in cmd
-        assert "cd /tmp/work" in cmd
+        assert cmd[-2:] == ["--prompt-interactive", "Do research"]
 
 
 class TestSpawnExternalNameValidation:
@@ -117,7 +151,7 @@ class TestSpawnExternalNameValidation:
 class TestSpawnExternal:
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_registers_member_before_spawn(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
-        mock_subprocess.run.return_value.stdout = "%42\n"
+        mock_subprocess.run.return_value.stdout = b"%42\n"
         spawn_external(
             TEAM,
             "researcher",
@@ -133,7 +167,7 @@ class TestSpawnExternal:
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_does_not_write_prompt_to_inbox(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
         """Prompt is passed via CLI args, not inbox. Inbox should be empty after spawn."""
-        mock_subprocess.run.return_value.stdout = "%42\n"
+        mock_subprocess.run.return_value.stdout = b"%42\n"
         spawn_external(
             TEAM,
             "researcher",
@@ -147,7 +181,7 @@ class TestSpawnExternal:
 
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_updates_pane_id(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
-        mock_subprocess.run.return_value.stdout = "%42\n"
+        mock_subprocess.run.return_value.stdout = b"%42\n"
         member = spawn_external(
             TEAM,
             "researcher",
@@ -169,7 +203,7 @@ class TestSpawnExternal:
         monkeypatch,
     ) -> None:
         monkeypatch.setenv("USE_TMUX_WINDOWS", "0")
-        mock_subprocess.run.return_value.stdout = "@42\n"
+        mock_subprocess.run.return_value.stdout = b"@42\n"
         member = spawn_external(
             TEAM,
             "window-worker",
@@ -180,7 +214,7 @@ class TestSpawnExternal:
         )
         assert member.tmux_pane_id == "@42"
         call_args = mock_subprocess.run.call_args[0][0]
-        assert call_args[:5] == ["tmux", "new-window", "-dP", "-F", "#{window_id}"]
+        assert call_args[:5] == [TMUX_BINARY, "new-window", "-dP", "-F", "#{window_id}"]
         assert "-n" in call_args
         assert call_args[call_args.index("-n") + 1] == "@claude-team | window-worker"
 
@@ -188,8 +222,8 @@ class TestSpawnExternal:
     def test_should_rollback_member_when_tmux_spawn_fails(self, mock_run: MagicMock, team_dir: Path) -> None:
         import subprocess as sp
 
-        mock_run.side_effect = sp.CalledProcessError(1, ["tmux", "split-window"])
-        with pytest.raises(sp.CalledProcessError):
+        mock_run.side_effect = sp.CalledProcessError(1, ["tmux", "split-window"], stderr=b"no space for new pane")
+        with pytest.raises(RuntimeError, match="no space for new pane"):
             spawn_external(
                 TEAM,
                 "broken-worker",
@@ -206,7 +240,7 @@ class TestSpawnExternal:
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_should_kill_orphan_pane_when_config_write_fails(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
         """If tmux spawn succeeds but config write-back fails, the pane must be killed."""
-        mock_subprocess.run.return_value.stdout = "%99\n"
+        mock_subprocess.run.return_value.stdout = b"%99\n"
 
         killed_panes: list[str] = []
 
@@ -240,9 +274,29 @@ class TestSpawnExternal:
 
         assert "%99" in killed_panes
 
+    @patch("claude_teams.claude_side.spawner.subprocess")
+    def test_concurrent_duplicate_spawn_starts_one_pane(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
+        mock_subprocess.run.return_value.stdout = b"%42\n"
+
+        def spawn() -> TeammateMember | Exception:
+            try:
+                return spawn_external(TEAM, "twin", "Do stuff", "codex", BINARIES, base_dir=team_dir)
+            except ValueError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: spawn(), range(4)))
+
+        assert sum(isinstance(r, TeammateMember) for r in results) == 1
+        assert all("already exists" in str(r) for r in results if isinstance(r, ValueError))
+        spawns = [c for c in mock_subprocess.run.call_args_list if c[0][0][1] != "list-sessions"]
+        assert len(spawns) == 1
+        names = [m.name for m in teams.read_config(TEAM, base_dir=team_dir).members]
+        assert names.count("twin") == 1
+
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_codex_should_use_prompt_wrapper(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
-        mock_subprocess.run.return_value.stdout = "%42\n"
+        mock_subprocess.run.return_value.stdout = b"%42\n"
         spawn_external(
             TEAM,
             "codex-worker",
@@ -252,14 +306,26 @@ class TestSpawnExternal:
             base_dir=team_dir,
         )
         call_args = mock_subprocess.run.call_args[0][0]
-        cmd_str = call_args[-1]
-        assert "codex-worker" in cmd_str
-        assert TEAM in cmd_str
-        assert "send_message" in cmd_str
+        prompt = call_args[-1]
+        assert "codex-worker" in prompt
+        assert TEAM in prompt
+        assert "send_message" in prompt
+
+    @patch("claude_teams.claude_side.spawner.subprocess")
+    def test_prompt_roster_comes_from_registration(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
+        mock_subprocess.run.return_value.stdout = b"%42\n"
+        teams.add_member(TEAM, _make_member("reviewer"), base_dir=team_dir)
+        with patch("claude_teams.common.teams.read_config", wraps=teams.read_config) as mock_read:
+            spawn_external(TEAM, "worker", "Do stuff", "codex", BINARIES, base_dir=team_dir)
+        # One locked read to register the agent, one to record its pane.
+        assert mock_read.call_count == 2
+        prompt = mock_subprocess.run.call_args[0][0][-1]
+        assert "reviewer" in prompt
+        assert "team-lead" in prompt
 
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_member_has_in_process_backend_type(self, mock_subprocess: MagicMock, team_dir: Path) -> None:
-        mock_subprocess.run.return_value.stdout = "%42\n"
+        mock_subprocess.run.return_value.stdout = b"%42\n"
         member = spawn_external(
             TEAM,
             "worker",
@@ -275,60 +341,117 @@ class TestKillTmuxPane:
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_calls_subprocess(self, mock_subprocess: MagicMock) -> None:
         kill_tmux_pane("%99")
-        mock_subprocess.run.assert_called_once_with(["tmux", "kill-pane", "-t", "%99"], check=False)
+        mock_subprocess.run.assert_called_once_with(
+            [TMUX_BINARY, "kill-pane", "-t", "%99"],
+            stdout=mock_subprocess.DEVNULL,
+            stderr=mock_subprocess.DEVNULL,
+            check=False,
+        )
 
     @patch("claude_teams.claude_side.spawner.subprocess")
     def test_calls_kill_window_for_window_target(self, mock_subprocess: MagicMock) -> None:
         kill_tmux_pane("@99")
-        mock_subprocess.run.assert_called_once_with(["tmux", "kill-window", "-t", "@99"], check=False)
+        mock_subprocess.run.assert_called_once_with(
+            [TMUX_BINARY, "kill-window", "-t", "@99"],
+            stdout=mock_subprocess.DEVNULL,
+            stderr=mock_subprocess.DEVNULL,
+            check=False,
+        )
 
 
 class TestBuildTmuxSpawnArgs:
     @patch("claude_teams.claude_side.spawner._has_tmux_session", return_value=True)
     def test_uses_split_window_when_session_exists(self, _mock: MagicMock) -> None:
-        args = build_tmux_spawn_args("echo hi", "worker")
-        assert args[:2] == ["tmux", "split-window"]
+        args = build_tmux_spawn_args(["echo", "hi"], "worker", "/tmp/work")
+        assert args[:2] == [TMUX_BINARY, "split-window"]
 
     @patch("claude_teams.claude_side.spawner._has_tmux_session", return_value=False)
     def test_uses_new_session_when_no_session(self, _mock: MagicMock) -> None:
-        args = build_tmux_spawn_args("echo hi", "worker")
-        assert args[:2] == ["tmux", "new-session"]
+        args = build_tmux_spawn_args(["echo", "hi"], "worker", "/tmp/work")
+        assert args[:2] == [TMUX_BINARY, "new-session"]
         assert "-d" in args
         assert "-s" in args
         session_idx = args.index("-s")
         assert args[session_idx + 1] == "claude-agent-worker"
-        assert "echo hi" in args
+        assert args[-2:] == ["echo", "hi"]
 
     @patch("claude_teams.claude_side.spawner._has_tmux_session", return_value=False)
     def test_new_session_sets_reasonable_size(self, _mock: MagicMock) -> None:
-        args = build_tmux_spawn_args("echo hi", "w")
+        args = build_tmux_spawn_args(["echo", "hi"], "w", "/tmp/work")
         assert "-x" in args and "200" in args
         assert "-y" in args and "50" in args
 
     def test_uses_new_window_when_env_set(self, monkeypatch) -> None:
         monkeypatch.setenv("USE_TMUX_WINDOWS", "1")
-        args = build_tmux_spawn_args("echo hi", "worker")
-        assert args[:2] == ["tmux", "new-window"]
+        args = build_tmux_spawn_args(["echo", "hi"], "worker", "/tmp/work")
+        assert args[:2] == [TMUX_BINARY, "new-window"]
+
+    @patch("claude_teams.claude_side.spawner._has_tmux_session", return_value=True)
+    def test_sets_cwd_and_passes_argv_unquoted(self, _mock: MagicMock) -> None:
+        args = build_tmux_spawn_args(["codex", "it's a prompt"], "worker", "/tmp/work")
+        assert args[args.index("-c") + 1] == "/tmp/work"
+        assert args[-2:] == ["codex", "it's a prompt"]
+
+    @patch("claude_teams.claude_side.spawner._has_tmux_session", return_value=True)
+    def test_escapes_trailing_semicolon(self, _mock: MagicMock) -> None:
+        args = build_tmux_spawn_args(["codex", "do this;"], "worker", "/tmp/work")
+        assert args[-1] == "do this\\;"
+
+
+class TestKillTmuxPanes:
+    @patch("claude_teams.claude_side.spawner.subprocess")
+    def test_kills_all_targets_in_one_invocation(self, mock_subprocess: MagicMock) -> None:
+        mock_subprocess.run.return_value.returncode = 0
+        kill_tmux_panes(["%1", "@2"])
+        mock_subprocess.run.assert_called_once()
+        assert mock_subprocess.run.call_args[0][0] == [
+            TMUX_BINARY,
+            "kill-pane",
+            "-t",
+            "%1",
+            ";",
+            "kill-window",
+            "-t",
+            "@2",
+        ]
+
+    @patch("claude_teams.claude_side.spawner.subprocess")
+    def test_falls_back_to_individual_kills_on_failure(self, mock_subprocess: MagicMock) -> None:
+        mock_subprocess.run.return_value.returncode = 1
+        kill_tmux_panes(["%1", "%2"])
+        targets = [c[0][0][1:] for c in mock_subprocess.run.call_args_list[1:]]
+        assert targets == [["kill-pane", "-t", "%1"], ["kill-pane", "-t", "%2"]]
+
+    @patch("claude_teams.claude_side.spawner.subprocess")
+    def test_no_targets(self, mock_subprocess: MagicMock) -> None:
+        kill_tmux_panes([])
+        mock_subprocess.run.assert_not_called()
 
 
 class TestHasTmuxSession:
     @patch("claude_teams.claude_side.spawner.subprocess.run")
     def test_returns_true_when_sessions_exist(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="work: 1 windows\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"work: 1 windows\n")
         assert _has_tmux_session() is True
 
     @patch("claude_teams.claude_side.spawner.subprocess.run")
     def test_returns_false_when_no_server(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=1, stdout="")
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"")
         assert _has_tmux_session() is False
 
     @patch("claude_teams.claude_side.spawner.subprocess.run")
     def test_returns_false_when_empty_output(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"")
         assert _has_tmux_session() is False
 
 
 class TestDiscoverBackendBinaries:
+    @pytest.fixture(autouse=True)
+    def _fresh_discovery(self, monkeypatch):
+        monkeypatch.delenv("CLAUDE_TEAMS_CODEX_BIN", raising=False)
+        monkeypatch.delenv("CLAUDE_TEAMS_GEMINI_BIN", raising=False)
+        monkeypatch.setattr(spawner, "_binary_cache", None)
+
     @patch("claude_teams.claude_side.spawner.shutil.which")
     def test_should_find_codex_binary(self, mock_which: MagicMock) -> None:
         mock_which.side_effect = lambda name: "/usr/local/bin/codex" if name == "codex" else None
@@ -353,3 +476,26 @@ class TestDiscoverBackendBinaries:
         mock_which.return_value = None
         result = discover_backend_binaries()
         assert result == {}
+
+    @patch("claude_teams.claude_side.spawner.shutil.which")
+    def test_should_prefer_pinned_path_from_env(self, mock_which: MagicMock, monkeypatch) -> None:
+        monkeypatch.setenv("CLAUDE_TEAMS_CODEX_BIN", "/opt/codex/bin/codex")
+        mock_which.return_value = None
+        result = discover_backend_binaries()
+        assert result == {"codex": "/opt/codex/bin/codex"}
+        assert [c[0][0] for c in mock_which.call_args_list] == ["gemini"]
+
+    @patch("claude_teams.claude_side.spawner.shutil.which")
+    def test_should_cache_result(self, mock_which: MagicMock) -> None:
+        mock_which.return_value = None
+        discover_backend_binaries()
+        discover_backend_binaries()
+        assert mock_which.call_count == 2  # one PATH lookup per backend
+
+    @patch("claude_teams.claude_side.spawner.shutil.which")
+    def test_should_rediscover_when_path_changes(self, mock_which: MagicMock, monkeypatch) -> None:
+        mock_which.return_value = None
+        assert discover_backend_binaries() == {}
+        monkeypatch.setenv("PATH", "/opt/new/bin")
+        mock_which.side_effect = lambda name: "/opt/new/bin/codex" if name == "codex" else None
+        assert discover_backend_binaries() == {"codex": "/opt/new/bin/codex"}
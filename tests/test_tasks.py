@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -119,6 +120,29 @@ def test_list_tasks_empty(tmp_claude_dir, team_tasks_dir):
     assert tasks == []
 
 
+def test_list_tasks_ignores_non_task_files(tmp_claude_dir, team_tasks_dir):
+    create_task("test-team", "A", "d1", base_dir=tmp_claude_dir)
+    (team_tasks_dir / "notes.json").write_text("{}")
+    (team_tasks_dir / "2.json.tmp").write_text("{}")
+    tasks = list_tasks("test-team", base_dir=tmp_claude_dir)
+    assert [t.id for t in tasks] == ["1"]
+    assert next_task_id("test-team", base_dir=tmp_claude_dir) == "2"
+
+
+def test_failed_write_keeps_previous_task_file(tmp_claude_dir, team_tasks_dir, monkeypatch):
+    create_task("test-team", "A", "d1", base_dir=tmp_claude_dir)
+    before = (team_tasks_dir / "1.json").read_bytes()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        update_task("test-team", "1", subject="B", base_dir=tmp_claude_dir)
+    assert (team_tasks_dir / "1.json").read_bytes() == before
+    assert list(team_tasks_dir.glob("*.tmp")) == []
+
+
 def test_reset_owner_tasks_reverts_status(tmp_claude_dir, team_tasks_dir):
     task = create_task("test-team", "Sub", "desc", base_dir=tmp_claude_dir)
     update_task(
@@ -405,3 +429,25 @@ def test_reset_owner_tasks_preserves_completed_status(tmp_claude_dir, team_tasks
     after = get_task("test-team", task.id, base_dir=tmp_claude_dir)
     assert after.status == "completed"
     assert after.owner is None
+
+
+def test_update_task_reads_each_task_file_once(tmp_claude_dir, team_tasks_dir, monkeypatch):
+    a = create_task("test-team", "A", "d", base_dir=tmp_claude_dir)
+    b = create_task("test-team", "B", "d", base_dir=tmp_claude_dir)
+    c = create_task("test-team", "C", "d", base_dir=tmp_claude_dir)
+    d = create_task("test-team", "D", "d", base_dir=tmp_claude_dir)
+    update_task("test-team", b.id, add_blocked_by=[a.id], base_dir=tmp_claude_dir)
+    update_task("test-team", c.id, add_blocked_by=[a.id], base_dir=tmp_claude_dir)
+
+    reads: list[str] = []
+    real_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self.name)
+        return real_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    update_task("test-team", d.id, add_blocked_by=[b.id, c.id], base_dir=tmp_claude_dir)
+
+    assert sorted(reads) == sorted(f"{t.id}.json" for t in (a, b, c, d))
+    assert set(get_task("test-team", d.id, base_dir=tmp_claude_dir).blocked_by) == {b.id, c.id}
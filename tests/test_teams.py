@@ -2,13 +2,25 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import stat
 import time
 import unittest.mock
 
 import pytest
 
+from claude_teams.common import _atomic
 from claude_teams.common.models import LeadMember, TeamConfig, TeammateMember
-from claude_teams.common.teams import add_member, create_team, delete_team, read_config, remove_member, write_config
+from claude_teams.common.teams import (
+    add_member,
+    create_team,
+    delete_team,
+    get_member,
+    read_config,
+    remove_member,
+    transact,
+    update_member,
+    write_config,
+)
 
 
 def _make_teammate(name: str, team_name: str) -> TeammateMember:
@@ -114,6 +126,58 @@ class TestMembers:
         assert len(cfg.members) == 1
         assert cfg.members[0].name == "team-lead"
 
+    def test_update_member_sets_fields(self, tmp_claude_dir: Path) -> None:
+        create_team("squad4", "sess-1", base_dir=tmp_claude_dir)
+        add_member("squad4", _make_teammate("coder", "squad4"), base_dir=tmp_claude_dir)
+        update_member("squad4", "coder", base_dir=tmp_claude_dir, tmux_pane_id="%7", is_active=True)
+
+        cfg = read_config("squad4", base_dir=tmp_claude_dir)
+        assert cfg.members[1].tmux_pane_id == "%7"
+        assert cfg.members[1].is_active is True
+
+    def test_transact_writes_changes_and_returns_result(self, tmp_claude_dir: Path) -> None:
+        create_team("squad7", "sess-1", base_dir=tmp_claude_dir)
+
+        def rename(cfg: TeamConfig) -> str:
+            cfg.description = "renamed"
+            return cfg.name
+
+        assert transact("squad7", rename, base_dir=tmp_claude_dir) == "squad7"
+        assert read_config("squad7", base_dir=tmp_claude_dir).description == "renamed"
+
+    def test_transact_skips_write_when_fn_raises(self, tmp_claude_dir: Path) -> None:
+        create_team("squad8", "sess-1", base_dir=tmp_claude_dir)
+
+        def fail(cfg: TeamConfig) -> None:
+            cfg.description = "changed"
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError, match="nope"):
+            transact("squad8", fail, base_dir=tmp_claude_dir)
+        assert read_config("squad8", base_dir=tmp_claude_dir).description == ""
+
+    def test_transact_missing_team_does_not_create_dir(self, tmp_claude_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            transact("ghost-team", lambda cfg: None, base_dir=tmp_claude_dir)
+        assert not (tmp_claude_dir / "teams" / "ghost-team").exists()
+
+    def test_get_member_tracks_config_changes(self, tmp_claude_dir: Path) -> None:
+        create_team("squad6", "sess-1", base_dir=tmp_claude_dir)
+        assert get_member("squad6", "coder", base_dir=tmp_claude_dir) is None
+        add_member("squad6", _make_teammate("coder", "squad6"), base_dir=tmp_claude_dir)
+        assert get_member("squad6", "coder", base_dir=tmp_claude_dir).tmux_pane_id == "%1"
+        update_member("squad6", "coder", base_dir=tmp_claude_dir, tmux_pane_id="%9")
+        assert get_member("squad6", "coder", base_dir=tmp_claude_dir).tmux_pane_id == "%9"
+
+    def test_get_member_missing_team_raises(self, tmp_claude_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            get_member("no-such-team", "coder", base_dir=tmp_claude_dir)
+
+    def test_update_member_rejects_unknown_member(self, tmp_claude_dir: Path) -> None:
+        create_team("squad5", "sess-1", base_dir=tmp_claude_dir)
+        with pytest.raises(ValueError, match="not found"):
+            update_member("squad5", "ghost", base_dir=tmp_claude_dir, tmux_pane_id="%7")
+
 
 class TestDuplicateMember:
     def test_should_reject_duplicate_member_name(self, tmp_claude_dir: Path) -> None:
@@ -150,6 +214,25 @@ class TestWriteConfig:
         tmp_files = list(config_dir.glob("*.tmp"))
         assert tmp_files == [], f"Leaked temp files: {tmp_files}"
 
+    def test_should_keep_file_mode_across_rewrites(self, tmp_claude_dir: Path) -> None:
+        create_team("perms", "sess-1", base_dir=tmp_claude_dir)
+        config_path = tmp_claude_dir / "teams" / "perms" / "config.json"
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o666 & ~_atomic._UMASK
+
+        config_path.chmod(0o644)
+        write_config("perms", read_config("perms", base_dir=tmp_claude_dir), base_dir=tmp_claude_dir)
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o644
+
+    def test_writes_indented_utf8_json(self, tmp_claude_dir: Path) -> None:
+        create_team("pretty", "sess-1", description="équipe", base_dir=tmp_claude_dir)
+        config = read_config("pretty", base_dir=tmp_claude_dir)
+        write_config("pretty", config, base_dir=tmp_claude_dir)
+
+        data = (tmp_claude_dir / "teams" / "pretty" / "config.json").read_bytes()
+        assert data.startswith(b'{\n  "name": "pretty",')
+        assert json.loads(data.decode("utf-8"))["description"] == "équipe"
+        assert read_config("pretty", base_dir=tmp_claude_dir).description == "équipe"
+
 
 class TestTeamExists:
     def test_should_return_true_for_existing_team(self, tmp_claude_dir: Path) -> None:
@@ -0,0 +1,122 @@
+"""Tests for claude_side/tmux_introspection.py — pane resolution and capture."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from claude_teams.claude_side import tmux_introspection
+from claude_teams.claude_side.tmux_introspection import forget_pane_target, peek_pane, resolve_pane_target
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolve_cache():
+    tmux_introspection._pane_resolve_cache.clear()
+    tmux_introspection._window_refresh = None
+    yield
+    tmux_introspection._pane_resolve_cache.clear()
+    tmux_introspection._window_refresh = None
+
+
+class TestResolvePaneTarget:
+    async def test_empty_target(self) -> None:
+        assert await resolve_pane_target("") == (None, "no tmux target recorded")
+
+    async def test_pane_id_used_as_is(self) -> None:
+        assert await resolve_pane_target("%5") == ("%5", None)
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_window_prefers_active_pane(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "@3\t%1\t0\n@3\t%2\t1\n", "")
+        assert await resolve_pane_target("@3") == ("%2", None)
+        assert mock_tmux.call_args[0][:2] == ("list-panes", "-a")
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_window_falls_back_to_first_pane(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "@3\t%1\t0\n@3\t%2\t0\n", "")
+        assert await resolve_pane_target("@3") == ("%1", None)
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_window_resolution_is_cached(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "@3\t%2\t1\n", "")
+        assert await resolve_pane_target("@3") == ("%2", None)
+        assert await resolve_pane_target("@3") == ("%2", None)
+        assert mock_tmux.await_count == 1
+
+        forget_pane_target("@3")
+        await resolve_pane_target("@3")
+        assert mock_tmux.await_count == 2
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_window_resolution_expires(self, mock_tmux: AsyncMock, monkeypatch) -> None:
+        monkeypatch.setattr(tmux_introspection, "_PANE_RESOLVE_TTL", 0)
+        mock_tmux.return_value = (0, "@3\t%2\t1\n", "")
+        await resolve_pane_target("@3")
+        await resolve_pane_target("@3")
+        assert mock_tmux.await_count == 2
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_window_not_found(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "@1\t%1\t1\n", "")
+        assert await resolve_pane_target("@3") == (None, "can't find window: @3")
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_tmux_error_is_reported(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (1, "", "no server running on /tmp/tmux-0/default\n")
+        assert await resolve_pane_target("@3") == (None, "no server running on /tmp/tmux-0/default")
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_concurrent_windows_share_one_listing(self, mock_tmux: AsyncMock) -> None:
+        async def slow_tmux(*args: str) -> tuple[int, str, str]:
+            await asyncio.sleep(0.01)
+            return 0, "@1\t%1\t1\n@2\t%2\t1\n@3\t%3\t1\n", ""
+
+        mock_tmux.side_effect = slow_tmux
+        results = await asyncio.gather(*(resolve_pane_target(f"@{i}") for i in range(1, 4)))
+        assert results == [("%1", None), ("%2", None), ("%3", None)]
+        assert mock_tmux.await_count == 1
+
+
+class TestPeekPane:
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_alive_with_output(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "0\nline 1\nline 2\n\n", "")
+        assert await peek_pane("%5", 20) == {"alive": True, "output": "line 1\nline 2", "error": None}
+        mock_tmux.assert_awaited_once()
+        assert mock_tmux.call_args[0][-3:] == ("-S", "-20", "-J")
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_status_only_skips_capture(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "0\n", "")
+        assert await peek_pane("%5", 0) == {"alive": True, "output": "", "error": None}
+        assert "capture-pane" not in mock_tmux.call_args[0]
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_dead_pane(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (0, "1\n", "")
+        result = await peek_pane("%5", 1)
+        assert result["alive"] is False
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_missing_pane(self, mock_tmux: AsyncMock) -> None:
+        mock_tmux.return_value = (1, "\n", "can't find pane: %5\n")
+        assert await peek_pane("%5", 1) == {"alive": False, "output": "", "error": "can't find pane: %5"}
+
+    @patch("claude_teams.claude_side.tmux_introspection._tmux", new_callable=AsyncMock)
+    async def test_concurrent_peeks_overlap(self, mock_tmux: AsyncMock) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def slow_tmux(*args: str) -> tuple[int, str, str]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 0, "0\n", ""
+
+        mock_tmux.side_effect = slow_tmux
+        await asyncio.gather(*(peek_pane(f"%{i}", 1) for i in range(3)))
+        assert peak == 3
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from pathlib import Path
-from unittest.mock import patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -20,6 +22,16 @@ def team_dir(tmp_claude_dir: Path) -> Path:
     return tmp_claude_dir
 
 
+@pytest.fixture(autouse=True)
+def no_control_mode(monkeypatch):
+    """Keep tests from attaching to a real tmux server."""
+
+    async def refuse(pane_id):
+        raise OSError("no tmux in tests")
+
+    monkeypatch.setattr(watcher.PersistentTmuxSender, "open", refuse)
+
+
 @pytest.fixture(autouse=True)
 def clean_watchers():
     """Ensure no leftover watchers between tests."""
@@ -60,6 +72,35 @@ class TestWatcherLifecycle:
             assert not task2.done()
             assert watcher.is_watching(TEAM, "agent1") is True
 
+    async def test_replaced_watcher_leaves_connection_to_successor(self, monkeypatch) -> None:
+        sender = MagicMock(closed=False)
+        sender.aclose = AsyncMock()
+
+        async def fake_open(pane_id):
+            return sender
+
+        monkeypatch.setattr(watcher.PersistentTmuxSender, "open", fake_open)
+
+        async def watcher_task(done: asyncio.Event):
+            await watcher._get_sender("%42")
+            await done.wait()
+            await watcher._close_sender("%42")
+
+        old_done, new_done = asyncio.Event(), asyncio.Event()
+        old = asyncio.create_task(watcher_task(old_done))
+        await asyncio.sleep(0)
+        new = asyncio.create_task(watcher_task(new_done))
+        await asyncio.sleep(0)
+
+        # The replaced watcher exits after its successor reused the connection.
+        old_done.set()
+        await old
+        sender.aclose.assert_not_awaited()
+        new_done.set()
+        await new
+        sender.aclose.assert_awaited_once()
+        assert "%42" not in watcher._senders
+
     async def test_stop_all(self, team_dir: Path) -> None:
         messaging.ensure_inbox(TEAM, "a1", base_dir=team_dir)
         messaging.ensure_inbox(TEAM, "a2", base_dir=team_dir)
@@ -73,6 +114,16 @@ class TestWatcherLifecycle:
             assert watcher.is_watching(TEAM, "a1") is False
             assert watcher.is_watching(TEAM, "a2") is False
 
+    async def test_drain_waits_for_watchers_to_finish(self, team_dir: Path) -> None:
+        messaging.ensure_inbox(TEAM, "a1", base_dir=team_dir)
+
+        with patch("claude_teams.claude_side.watcher.inject_messages"):
+            task = watcher.start_watcher(TEAM, "a1", "%1", base_dir=team_dir)
+            await asyncio.sleep(0)
+
+            assert await watcher.drain_watchers() == 1
+            assert task.done()
+
 
 class TestWatcherMessageDelivery:
     async def test_delivers_new_messages(self, team_dir: Path) -> None:
@@ -80,7 +131,7 @@ class TestWatcherMessageDelivery:
         messaging.ensure_inbox(TEAM, "codex1", base_dir=team_dir)
         injected: list = []
 
-        def fake_inject(pane_id, msgs):
+        def fake_inject(pane_id, msgs, sender=None):
             injected.extend(msgs)
             return len(msgs)
 
@@ -156,7 +207,7 @@ class TestWatcherMessageDelivery:
         messaging.ensure_inbox(TEAM, "codex-retry", base_dir=team_dir)
         call_count = 0
 
-        def fail_then_succeed(pane_id, msgs):
+        def fail_then_succeed(pane_id, msgs, sender=None):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -193,7 +244,7 @@ class TestWatcherMessageDelivery:
 
         injected: list = []
 
-        def fake_inject(pane_id, msgs):
+        def fake_inject(pane_id, msgs, sender=None):
             injected.extend(msgs)
             return len(msgs)
 
@@ -202,3 +253,130 @@ class TestWatcherMessageDelivery:
             await asyncio.sleep(1.5)
 
         assert len(injected) == 0
+
+
+class TestWatcherEvents:
+    async def test_delivers_without_waiting_for_a_poll(self, team_dir: Path, monkeypatch) -> None:
+        monkeypatch.setattr(watcher, "_RESCAN_INTERVAL", 60.0)
+        messaging.ensure_inbox(TEAM, "fast", base_dir=team_dir)
+        delivered = asyncio.Event()
+
+        def fake_inject(pane_id, msgs, sender=None):
+            delivered.set()
+            return len(msgs)
+
+        with patch("claude_teams.claude_side.watcher.inject_messages", side_effect=fake_inject):
+            watcher.start_watcher(TEAM, "fast", "%70", base_dir=team_dir)
+            await asyncio.sleep(0.2)
+            messaging.send_plain_message(TEAM, "team-lead", "fast", "ping", summary="ping", base_dir=team_dir)
+            await asyncio.wait_for(delivered.wait(), 1.0)
+
+    async def test_keeps_checking_when_watching_fails(self, team_dir: Path, monkeypatch, caplog) -> None:
+        monkeypatch.setattr(watcher, "_RETRY_INTERVAL", 0.05)
+        monkeypatch.setattr(watcher, "_RESCAN_INTERVAL", 60.0)
+        modes: list = []
+
+        def broken_awatch(*args, force_polling=None, **kwargs):
+            modes.append(force_polling)
+            raise OSError("watch limit reached")
+
+        monkeypatch.setattr(watcher, "awatch", broken_awatch)
+        messaging.ensure_inbox(TEAM, "blind", base_dir=team_dir)
+        inbox_dir = messaging.inbox_path(TEAM, "blind", team_dir).parent
+        delivered = asyncio.Event()
+
+        def fake_inject(pane_id, msgs, sender=None):
+            delivered.set()
+            return len(msgs)
+
+        with patch("claude_teams.claude_side.watcher.inject_messages", side_effect=fake_inject):
+            watcher.start_watcher(TEAM, "blind", "%71", base_dir=team_dir)
+            await asyncio.sleep(0.1)
+            messaging.send_plain_message(TEAM, "team-lead", "blind", "ping", summary="ping", base_dir=team_dir)
+            await asyncio.wait_for(delivered.wait(), 1.0)
+
+        assert modes[:3] == [None, True, True]
+        assert not watcher._dir_watchers[inbox_dir][0].done()
+        assert "retrying" in caplog.text
+
+    async def test_agents_share_one_directory_watcher(self, team_dir: Path) -> None:
+        messaging.ensure_inbox(TEAM, "a1", base_dir=team_dir)
+        messaging.ensure_inbox(TEAM, "a2", base_dir=team_dir)
+        inbox_dir = messaging.inbox_path(TEAM, "a1", team_dir).parent
+
+        with patch("claude_teams.claude_side.watcher.inject_messages"):
+            watcher.start_watcher(TEAM, "a1", "%1", base_dir=team_dir)
+            watcher.start_watcher(TEAM, "a2", "%2", base_dir=team_dir)
+            await asyncio.sleep(0.1)
+            assert list(watcher._dir_watchers) == [inbox_dir]
+            assert set(watcher._wakeups[inbox_dir]) == {"a1.json", "a2.json"}
+            dir_task, _ = watcher._dir_watchers[inbox_dir]
+
+            watcher.stop_watcher(TEAM, "a1")
+            await asyncio.sleep(0.1)
+            assert inbox_dir in watcher._dir_watchers
+
+            watcher.stop_watcher(TEAM, "a2")
+            await asyncio.wait_for(dir_task, 1.0)
+            assert watcher._dir_watchers == {}
+            assert watcher._wakeups == {}
+
+    async def test_notices_change_that_moves_mtime_backwards(self, team_dir: Path) -> None:
+        messaging.ensure_inbox(TEAM, "clock", base_dir=team_dir)
+        inbox = messaging.inbox_path(TEAM, "clock", team_dir)
+        injected: list = []
+
+        def fake_inject(pane_id, msgs, sender=None):
+            injected.extend(m.text for m in msgs)
+            return len(msgs)
+
+        with patch("claude_teams.claude_side.watcher.inject_messages", side_effect=fake_inject):
+            watcher.start_watcher(TEAM, "clock", "%71", base_dir=team_dir)
+            await asyncio.sleep(0.2)
+            messaging.send_plain_message(TEAM, "team-lead", "clock", "one", summary="1", base_dir=team_dir)
+            await asyncio.sleep(0.5)
+            messaging.send_plain_message(TEAM, "team-lead", "clock", "two", summary="2", base_dir=team_dir)
+            os.utime(inbox, ns=(0, 0))
+            await asyncio.sleep(0.5)
+
+        assert injected == ["one", "two"]
+
+    async def test_inbox_io_runs_off_the_event_loop(self, team_dir: Path) -> None:
+        messaging.ensure_inbox(TEAM, "offload", base_dir=team_dir)
+        messaging.send_plain_message(TEAM, "team-lead", "offload", "hi", summary="hi", base_dir=team_dir)
+        threads: set[threading.Thread] = set()
+        real_read, real_mark = messaging.read_inbox, messaging.mark_messages_as_read
+
+        def read_inbox(*a, **kw):
+            threads.add(threading.current_thread())
+            return real_read(*a, **kw)
+
+        def mark_messages_as_read(*a, **kw):
+            threads.add(threading.current_thread())
+            return real_mark(*a, **kw)
+
+        with (
+            patch.object(messaging, "read_inbox", read_inbox),
+            patch.object(messaging, "mark_messages_as_read", mark_messages_as_read),
+            patch("claude_teams.claude_side.watcher.inject_messages", return_value=1),
+        ):
+            watcher.start_watcher(TEAM, "offload", "%72", base_dir=team_dir)
+            await asyncio.sleep(0.3)
+
+        assert threads
+        assert threading.main_thread() not in threads
+        assert messaging.read_inbox(TEAM, "offload", unread_only=True, mark_as_read=False, base_dir=team_dir) == []
+
+    async def test_gives_up_on_unreachable_pane(self, team_dir: Path, monkeypatch) -> None:
+        monkeypatch.setattr(watcher, "_RETRY_INTERVAL", 0.01)
+        monkeypatch.setattr(watcher, "_MAX_DELIVERY_FAILURES", 3)
+        messaging.ensure_inbox(TEAM, "gone", base_dir=team_dir)
+        messaging.send_plain_message(TEAM, "team-lead", "gone", "hello?", summary="hi", base_dir=team_dir)
+
+        with patch("claude_teams.claude_side.watcher.inject_messages", return_value=0) as mock_inject:
+            task = watcher.start_watcher(TEAM, "gone", "%73", base_dir=team_dir)
+            await asyncio.wait_for(task, 1.0)
+
+        assert mock_inject.call_count == 3
+        assert watcher.is_watching(TEAM, "gone") is False
+        assert watcher._watchers == {}